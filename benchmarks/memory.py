@@ -0,0 +1,169 @@
+from __future__ import annotations
+from typing import Any
+from collections.abc import Callable
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+
+from gamefiles.GameField import GameField
+from gamefiles.Signal import Signal
+from gamefiles.Modifier import Modifier
+from misc.Stat import Stat
+from objects.Bullet import Bullet
+from objects.Brick import Brick
+from objects.Stone import Stone
+from objects.Water import Water
+from objects.Mirror import Mirror
+
+from benchmarks.scenarios import commit, change
+from benchmarks.micro import empty_game
+
+'''
+Memory report: bytes per instance of the game's most numerous objects (headless)
+NOTE: run from the repository root
+    python -m benchmarks.memory
+    python -m benchmarks.memory --compare benchmarks/results/memory.json
+
+For every kind:
+    - shallowBytes: sys.getsizeof() of one instance (+ its __dict__ if it has one)
+    - retainedBytes: memory still allocated after creating "count" instances, divided by count (under tracemalloc)
+        - includes everything the instance keeps alive (Signals, Stats, cell/registry entries, etc.)
+
+---------------------------------
+FORMAT:
+@create(name={KIND NAME}, count=?)
+def _(game: GameField, i: int) -> object:
+    - creates the i-th instance (0 <= i < count)
+    ...
+'''
+
+KINDS: dict[str, dict[str, Any]] = {}
+def create(name: str, count: int):
+    def i(f: Callable[[GameField, int], object]):
+        KINDS[name] = {
+            "count": count,
+            "create": f,
+        }
+    return i
+
+
+# Items (one per cell, _empty stage leaves the player's cell)
+def cell_of(game: GameField, i: int) -> tuple[int, int]:
+    i += 1
+    return (i % game.c, i // game.c)
+
+@create(name="Stone", count=200)
+def _(game: GameField, i: int):
+    x, y = cell_of(game, i)
+    return Stone(game, x, y)
+
+@create(name="Brick", count=200)
+def _(game: GameField, i: int):
+    x, y = cell_of(game, i)
+    return Brick(game, x, y)
+
+@create(name="Water", count=200)
+def _(game: GameField, i: int):
+    x, y = cell_of(game, i)
+    return Water(game, x, y)
+
+@create(name="Mirror", count=200)
+def _(game: GameField, i: int):
+    x, y = cell_of(game, i)
+    return Mirror(game, x, y, ref_ori="northeast")
+
+
+# Entities
+@create(name="Bullet", count=1000)
+def _(game: GameField, i: int):
+    x, y = cell_of(game, i % 200)
+    return Bullet(game=game, x=x, y=y, ori="north", speed=0)
+
+@create(name="Tank", count=200)
+def _(game: GameField, i: int):
+    x, y = cell_of(game, i)
+    return game.tankFactory.tank(x=x, y=y, team="enemy", tank_type="Normal")
+
+
+# others
+@create(name="Signal", count=1000)
+def _(game: GameField, i: int):
+    return Signal[[int], None](game)
+
+@create(name="Modifier", count=1000)
+def _(game: GameField, i: int):
+    return Modifier(game=game, type="test")
+
+@create(name="Stat", count=1000)
+def _(game: GameField, i: int):
+    return Stat(game, 1)
+
+
+def shallow_size(obj: object) -> int:
+    size = sys.getsizeof(obj)
+    d = getattr(obj, "__dict__", None)
+    if d is not None:
+        size += sys.getsizeof(d)
+    return size
+
+def measure(name: str) -> dict[str, Any]:
+    kind = KINDS[name]
+    count: int = kind["count"]
+    game = empty_game()
+
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    instances = [kind["create"](game, i) for i in range(count)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "count": count,
+        "shallowBytes": shallow_size(instances[0]),
+        "retainedBytes": (current - base) / count,
+    }
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Bytes per instance of game objects")
+    parser.add_argument("--kind", action="append", choices=list(KINDS), help="kind to measure (repeatable, default: all)")
+    parser.add_argument("--out", default=os.path.join("benchmarks", "results", "memory.json"))
+    parser.add_argument("--compare", help="previously saved report to compare against")
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, Any] = {}
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["kinds"]
+
+    report: dict[str, Any] = {
+        "meta": {
+            "commit": commit(),
+            "python": sys.version.split()[0],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "kinds": {},
+    }
+    for name in args.kind or list(KINDS):
+        result = measure(name)
+        report["kinds"][name] = result
+
+        line = f"{name:>10}: shallow {result['shallowBytes']:6d}B retained {result['retainedBytes']:8.1f}B"
+        if name in baseline:
+            old = baseline[name]
+            line += f" | shallow {change(old['shallowBytes'], result['shallowBytes'])} retained {change(old['retainedBytes'], result['retainedBytes'])}"
+        print(line)
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
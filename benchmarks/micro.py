@@ -0,0 +1,235 @@
+from __future__ import annotations
+from typing import Any, get_args
+from collections.abc import Callable
+from time import perf_counter
+import argparse
+import json
+import os
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+
+from gamefiles.GameField import GameField
+from gamefiles.Signal import Signal
+from objects.Bullet import Bullet
+from misc.util import Orientation
+
+from benchmarks.scenarios import commit, change
+
+'''
+Microbenchmarks for hot primitives (headless)
+NOTE: run from the repository root
+    python -m benchmarks.micro
+    python -m benchmarks.micro --bench Signal.fire --bench Cell.add_remove_object
+
+Every bench is run once per size in its "sizes":
+    - setup builds a fresh headless GameField and returns the operation to measure
+    - ops/sec: the operation is repeated for at least --time seconds
+    - allocations (under tracemalloc):
+        - peakBytes: peak memory allocated during a single operation (temporary allocations)
+            - NOTE: this is net of whatever the operation frees first
+        - retainedBytesPerOp: memory still allocated after --alloc-ops operations, divided by ops
+
+---------------------------------
+FORMAT:
+@create(name={BENCH NAME}, sizes=[...])
+def _(game: GameField, n: int) -> Callable[[], None]:
+    ...
+    def op():
+        ...
+    return op
+'''
+
+BENCHES: dict[str, dict[str, Any]] = {}
+def create(name: str, sizes: list[int]):
+    def i(f: Callable[[GameField, int], Callable[[], None]]):
+        BENCHES[name] = {
+            "sizes": sizes,
+            "setup": f,
+        }
+    return i
+
+
+def bullets(game: GameField, n: int, x: int = 0, y: int = 0) -> list[Bullet]:
+    return [Bullet(game=game, x=x, y=y, ori="north", speed=0) for _ in range(n)]
+
+
+# Signal
+@create(name="Signal.fire", sizes=[0, 1, 10, 100])
+def _(game: GameField, n: int):
+    signal = Signal[[int], None](game)
+    for _ in range(n):
+        def listener(v: int):
+            pass
+        signal.add_listener(listener)
+    def op():
+        signal.fire(0)
+    return op
+
+@create(name="Signal.add_remove_listener", sizes=[0, 10, 100])
+def _(game: GameField, n: int):
+    signal = Signal[[int], None](game)
+    for _ in range(n):
+        def listener(v: int):
+            pass
+        signal.add_listener(listener)
+    def extra(v: int):
+        pass
+    def op():
+        signal.add_listener(extra)
+        signal.remove_listener(extra)
+    return op
+
+
+# Cell
+@create(name="Cell.add_remove_object", sizes=[1, 4, 16])
+def _(game: GameField, n: int):
+    cell = game[1, 1]
+    bullets(game, n - 1, x=1, y=1)
+    obj = bullets(game, 1)[0]
+    def op():
+        cell.add_object(obj)
+        cell.remove_object(obj)
+    return op
+
+@create(name="Cell.get_objects", sizes=[1, 4, 16])
+def _(game: GameField, n: int):
+    cell = game[1, 1]
+    bullets(game, n, x=1, y=1)
+    def op():
+        cell.get_objects()
+    return op
+
+
+# PhysicsManager
+@create(name="PhysicsManager.update", sizes=[0, 25, 100, 225])
+def _(game: GameField, n: int):
+    rng = random.Random(n)
+    orientations = get_args(Orientation)
+    cells = [(x, y) for y in range(game.r) for x in range(game.c)]
+    rng.shuffle(cells)
+    for x, y in cells[:n]:
+        tank = game.tankFactory.tank(x=x, y=y, team="enemy", tank_type="Normal")
+        tank.set_orientation(rng.choice(orientations))
+        tank.set_speed(game.FPS)
+    frame = 0
+    def op():
+        nonlocal frame
+        frame += 1
+        game.physics.update(frame)
+    return op
+
+
+# Renderer
+@create(name="Renderer.draw_cell", sizes=[225])
+def _(game: GameField, n: int):
+    game.start_stage("3")
+    renderer = game.renderer
+    cells = [(i, j, game.x(j), game.y(i)) for i in range(game.r) for j in range(game.c)][:n]
+    renderer.pre_draw_grid()
+    def op():
+        renderer._drawList.clear()
+        for i, j, x, y in cells:
+            renderer.draw_cell(0, i, j, x, y)
+    return op
+
+@create(name="Renderer.post_draw_grid", sizes=[225])
+def _(game: GameField, n: int):
+    game.start_stage("3")
+    renderer = game.renderer
+    renderer.pre_draw_grid()
+    for i in range(game.r):
+        for j in range(game.c):
+            renderer.draw_cell(0, i, j, game.x(j), game.y(i))
+    def op():
+        renderer.post_draw_grid()
+    return op
+
+
+def empty_game() -> GameField:
+    game = GameField(fps=60, headless=True)
+    game.start_stage("_empty")
+    return game
+
+def measure(op: Callable[[], None], min_time: float, alloc_ops: int) -> dict[str, float]:
+    # warmup + calibration
+    ops = 1
+    while True:
+        start = perf_counter()
+        for _ in range(ops):
+            op()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time / 10:
+            break
+        ops *= 2
+    ops = max(1, int(ops * min_time / max(elapsed, 1e-9) / 10) * 10)
+
+    start = perf_counter()
+    for _ in range(ops):
+        op()
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    op()
+    _, peak = tracemalloc.get_traced_memory()
+
+    base, _ = tracemalloc.get_traced_memory()
+    for _ in range(alloc_ops):
+        op()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops": ops,
+        "opsPerSec": ops / elapsed if elapsed > 0 else 0.0,
+        "usPerOp": elapsed / ops * 1e6,
+        "peakBytes": peak - base,
+        "retainedBytesPerOp": (current - base) / alloc_ops,
+    }
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Microbenchmarks for game primitives")
+    parser.add_argument("--bench", action="append", choices=list(BENCHES), help="bench to run (repeatable, default: all)")
+    parser.add_argument("--time", type=float, default=0.5, help="minimum seconds per measurement")
+    parser.add_argument("--alloc-ops", type=int, default=1000)
+    parser.add_argument("--out", default=os.path.join("benchmarks", "results", "micro.json"))
+    parser.add_argument("--compare", help="previously saved report to compare against")
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, Any] = {}
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["benches"]
+
+    report: dict[str, Any] = {
+        "meta": {
+            "commit": commit(),
+            "python": sys.version.split()[0],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "benches": {},
+    }
+    for name in args.bench or list(BENCHES):
+        bench = BENCHES[name]
+        for n in bench["sizes"]:
+            key = f"{name}[{n}]"
+            op = bench["setup"](empty_game(), n)
+            result = measure(op, min_time=args.time, alloc_ops=args.alloc_ops)
+            report["benches"][key] = result
+
+            line = f"{key:>34}: {result['opsPerSec']:12.0f} ops/s {result['usPerOp']:9.3f}us/op | peak {result['peakBytes']:8.0f}B retained {result['retainedBytesPerOp']:8.1f}B/op"
+            if key in baseline:
+                line += f" | ops/s {change(baseline[key]['opsPerSec'], result['opsPerSec'])}"
+            print(line)
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
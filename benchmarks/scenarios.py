@@ -0,0 +1,259 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, get_args
+from collections.abc import Callable
+from time import perf_counter
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+if TYPE_CHECKING:
+    from misc.backend import NullPyxel
+
+from gamefiles.GameField import GameField
+from gamefiles.Profiler import PHASES, DRAW_PHASES
+from misc.util import GameState, Orientation
+from resources.controls import CONTROLS
+
+'''
+Scenario benchmarks driving the real game loop (headless)
+NOTE: run from the repository root (stage files are loaded relative to it)
+    python -m benchmarks.scenarios
+    python -m benchmarks.scenarios --scenario _TEST --frames 5000 --seed 7 --render
+    python -m benchmarks.scenarios --render --dirty
+
+Every scenario:
+    - creates a headless GameField and starts its stage with a fixed seed
+    - drives the player with a seeded bot (always firing, turning every few frames, respawning when dead)
+    - restarts the stage whenever it is won or lost, so the load stays the same
+    - runs warmup frames, then profiles the given number of frames
+
+REPORT (saved as JSON, see --out):
+    meta
+        - commit, python, platform, timestamp, seed, frames, render, dirty
+    scenarios
+        - fps (wall clock, includes rendering if --render)
+        - frameMs: mean, p50, p95, p99, max
+        - phasesMs: mean and total per GameField.update() and draw phase (see gamefiles/Profiler.py)
+            - draw phases are 0 without --render
+        - redrawnCells: mean cells redrawn per frame (0 without --render, see Renderer dirty mode)
+        - restarts
+
+--compare {PATH}
+    - prints fps and frame time change against a previously saved report
+
+---------------------------------
+FORMAT:
+@create(name={SCENARIO NAME})
+def _():
+    def setup(game: GameField):
+        ...
+    def driver(game: GameField, backend: NullPyxel, frame: int):
+        - called before every frame
+        ...
+    return {
+        "stage": ?,
+
+        "setup": setup,     (optional)
+        "driver": driver,   (optional)
+    }
+'''
+
+SCENARIOS: dict[str, dict[str, Any]] = {}
+def create(name: str):
+    def i(f: Callable[[], dict[str, Any]]):
+        SCENARIOS[name] = f()
+    return i
+
+
+@create(name="_TEST")
+def _():
+    # the player spawns right next to the homes, don't let them end the run
+    def setup(game: GameField):
+        for home in game.stage.get_homes():
+            game.stage.remove_home(home)
+
+    # _TEST never spawns enemies by itself, keep every spawn busy instead
+    def driver(game: GameField, backend: NullPyxel, frame: int):
+        if frame % game.FPS != 0:
+            return
+        stage = game.stage
+        for i in range(len(stage.get_enemy_spawns())):
+            stage.spawn_enemy_delayed(spawn_index=i, tank_type=game.tankFactory.get_tank_types()[i % 3])
+    return {
+        "stage": "_TEST",
+        "setup": setup,
+        "driver": driver,
+    }
+
+@create(name="_kaRMa")
+def _():
+    return {
+        "stage": "_kaRMa",
+    }
+
+@create(name="3")
+def _():
+    return {
+        "stage": "3",
+    }
+
+
+def bot(seed: int) -> Callable[[GameField, NullPyxel, int], None]:
+    rng = random.Random(seed)
+    orientations = get_args(Orientation)
+    held: int | None = None
+    def drive(game: GameField, backend: NullPyxel, frame: int):
+        nonlocal held
+        backend.press(CONTROLS["fire"]["btn"])
+        backend.press(CONTROLS["respawn"]["btn"])
+        if frame % 20 == 0:
+            if held is not None:
+                backend.release(held)
+            held = CONTROLS[rng.choice(orientations)]["btn"]
+            backend.press(held)
+    return drive
+
+
+def percentile(values: list[float], p: float) -> float:
+    if len(values) == 0:
+        return 0.0
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered) + 0.5) - 1))
+    return ordered[k]
+
+def run_scenario(name: str, frames: int, seed: int, warmup: int = 120, render: bool = False, dirty: bool = False, fps: int = 60) -> dict[str, Any]:
+    scenario = SCENARIOS[name]
+    stage = scenario["stage"]
+
+    game = GameField(fps=fps, headless=True, seed=seed)
+    backend = game._nullBackend
+    assert backend is not None
+    game.renderer.set_dirty_mode(dirty)
+
+    game.start_stage(stage)
+    if "setup" in scenario:
+        scenario["setup"](game)
+
+    drive = bot(seed)
+    driver = scenario.get("driver")
+    restarts = 0
+    redrawn = 0
+    def frame_step(frame: int):
+        nonlocal restarts
+        state = game.get_game_state()
+        if state == GameState.WIN or state == GameState.LOSE:
+            restarts += 1
+            game.start_stage(stage)
+            if "setup" in scenario:
+                scenario["setup"](game)
+        drive(game, backend, frame)
+        if driver is not None:
+            driver(game, backend, frame)
+        game.step(render=render)
+
+    for frame in range(warmup):
+        frame_step(frame)
+
+    profiler = game.profiler
+    profiler.reset(capacity=frames)
+    profiler.enable()
+    start = perf_counter()
+    for frame in range(warmup, warmup + frames):
+        frame_step(frame)
+        if render:
+            redrawn += game.renderer.redrawnCells
+    elapsed = perf_counter() - start
+    profiler.disable()
+
+    samples = {phase: profiler.get_samples(phase) for phase in ("frame",) + PHASES + DRAW_PHASES}
+    frame_ms = [t * 1000 for t in samples["frame"]]
+    return {
+        "stage": stage,
+        "frames": frames,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "frameMs": {
+            "mean": sum(frame_ms) / len(frame_ms) if frame_ms else 0.0,
+            "p50": percentile(frame_ms, 50),
+            "p95": percentile(frame_ms, 95),
+            "p99": percentile(frame_ms, 99),
+            "max": max(frame_ms, default=0.0),
+        },
+        "phasesMs": {
+            phase: {
+                "mean": sum(samples[phase]) * 1000 / len(samples[phase]) if samples[phase] else 0.0,
+                "total": sum(samples[phase]) * 1000,
+            }
+            for phase in PHASES + DRAW_PHASES
+        },
+        "redrawnCells": redrawn / frames if frames > 0 else 0.0,
+        "restarts": restarts,
+    }
+
+
+def commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def change(old: float, new: float) -> str:
+    if old == 0:
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Scenario benchmarks for the game loop")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--render", action="store_true", help="also run the (null) draw pass every frame")
+    parser.add_argument("--dirty", action="store_true", help="draw with the Renderer dirty mode (implies --render)")
+    parser.add_argument("--out", default=os.path.join("benchmarks", "results", "scenarios.json"))
+    parser.add_argument("--compare", help="previously saved report to compare against")
+    args = parser.parse_args(argv)
+    if args.dirty:
+        args.render = True
+
+    baseline: dict[str, Any] = {}
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["scenarios"]
+
+    report: dict[str, Any] = {
+        "meta": {
+            "commit": commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "seed": args.seed,
+            "frames": args.frames,
+            "render": args.render,
+            "dirty": args.dirty,
+        },
+        "scenarios": {},
+    }
+    for name in args.scenario or list(SCENARIOS):
+        result = run_scenario(name, frames=args.frames, seed=args.seed, warmup=args.warmup, render=args.render, dirty=args.dirty)
+        report["scenarios"][name] = result
+
+        frame_ms = result["frameMs"]
+        print(f"{name:>10}: {result['fps']:9.1f} fps | p50 {frame_ms['p50']:.3f}ms p95 {frame_ms['p95']:.3f}ms p99 {frame_ms['p99']:.3f}ms")
+        print("            " + " ".join(f"{phase}={data['mean']:.3f}" for phase, data in result["phasesMs"].items()))
+        if name in baseline:
+            old = baseline[name]
+            print(f"            vs {args.compare}: fps {change(old['fps'], result['fps'])}, p50 {change(old['frameMs']['p50'], frame_ms['p50'])}, p99 {change(old['frameMs']['p99'], frame_ms['p99'])}")
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
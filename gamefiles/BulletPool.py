@@ -0,0 +1,83 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from collections.abc import Callable
+
+if TYPE_CHECKING:
+    from gamefiles.GameField import GameField
+    from objects.GameObject import GameObject
+    from objects.Tank import Tank
+
+from misc.util import Orientation
+from objects.Bullet import Bullet
+
+'''
+Recycling pool for Bullets (one per GameField)
+NOTE: create bullets through bullet() instead of Bullet() directly to make use of the pool !!
+
+A destroyed Bullet is only reused after the frame it was destroyed in has ended (see flush())
+    - same as Signals, anything still holding it can check is_destroyed() until then
+A reused Bullet is re-initialized in place (see Bullet.reset()):
+    - gets a new id (registry, physics, etc. see it as a brand new object)
+    - keeps its hash, so dicts/sets still holding it stay valid (see GameObject.id)
+    - owner, orientation, speed, debounce fields, modifiers and cell are reset
+    - its Signals start out uncreated again (the old ones are still destroyed as usual)
+
+BulletPool
+    hits: int
+        - bullets taken from the pool
+    misses: int
+        - bullets that had to be allocated
+
+    bullet(x: int, y: int, ori: Orientation, speed: float,
+           owner: Tank | None = None,
+           pre_added: Callable[[GameObject], bool] | None = None) -> Bullet
+    get_free_count() -> int
+    get_pooled() -> set[Bullet]
+        - destroyed Bullets kept by the pool (free + released this frame)
+
+    ---------------------------------
+    INTERNALS
+
+    release(bullet: Bullet)
+        - called by Bullet on destroy
+    flush()
+        - called by GameField at the end of every frame
+        - makes the bullets released this frame available
+'''
+
+class BulletPool:
+    def __init__(self, game: GameField):
+        self.game = game
+        self.hits = 0
+        self.misses = 0
+        self._free = list[Bullet]()
+        self._released = list[Bullet]()
+
+    def bullet(self, x: int, y: int, ori: Orientation, speed: float,
+               owner: Tank | None = None,
+               pre_added: Callable[[GameObject], bool] | None = None) -> Bullet:
+        if len(self._free) == 0:
+            self.misses += 1
+            return Bullet(game=self.game, x=x, y=y, ori=ori, speed=speed, owner=owner, pre_added=pre_added)
+
+        self.hits += 1
+        bullet = self._free.pop()
+        bullet.reset(game=self.game, x=x, y=y, ori=ori, speed=speed, owner=owner, pre_added=pre_added)
+        return bullet
+
+    def get_free_count(self) -> int:
+        return len(self._free)
+
+    def get_pooled(self) -> set[Bullet]:
+        return set(self._free + self._released)
+
+    # ---------------------------------
+    # internal
+    def release(self, bullet: Bullet):
+        self._released.append(bullet)
+
+    def flush(self):
+        if len(self._released) == 0:
+            return
+        self._free.extend(self._released)
+        self._released.clear()
@@ -6,6 +6,9 @@ if TYPE_CHECKING:
     from objects.GameObject import GameObject
 
 from objects.Item import Item
+from objects.Entity import Entity
+from objects.Tank import Tank
+from objects.Bullet import Bullet
 
 
 
@@ -15,28 +18,64 @@ A container class for all GameObjects
 Cell:
     game: GameField
         - reference to game
-    _type: Item
-        - object that determines cell's type (only one)
-    _objects: list[GameObject]
-        - the GameObjects currently occupying the cell
     
     x: int
     y: int
+
+    LAYERS:
+        - Items and Entities are kept in their own layer, everything else (Powerups, etc.) is only in _objects
+        - layers are dicts used as insertion-ordered sets (O(1) add/remove/contains)
+
+        _type: Item | None
+            - object that determines cell's type (only one)
+        _entities: dict[Entity, None]
+    _objects: dict[GameObject, None]
+        - all GameObjects in the cell, in the order they were added
+    _objectsView, _entitiesView, _tanksView, _bulletsView
+        - cached accessor results (None if outdated)
+    _itemVersion: int
+        - incremented whenever the Item changes or has to be redrawn (see Renderer terrain layers)
+    _version: int
+        - incremented whenever anything in the cell changes or has to be redrawn (see Renderer dirty mode)
     
     get_item() -> Item | None
         - returns current Item
+    get_item_version() -> int
+    refresh_item()
+        - called by an Item whose look changed (e.g. Brick cracking)
+    get_version() -> int
+    refresh()
+        - called by a GameObject whose look changed (see GameObject.refresh_render_key())
     
-    get_objects() -> list[GameObject]
-        - returns all GameObjects currently occupying the cell
+    get_objects() -> tuple[GameObject, ...]
+        - returns all GameObjects currently occupying the cell (in the order they were added)
+        - immutable snapshot, only rebuilt after the cell changes (safe to keep iterating while objects move/get destroyed)
+    get_entities() -> tuple[Entity, ...]
+    tanks() -> tuple[Tank, ...]
+    bullets() -> tuple[Bullet, ...]
+        - same as get_objects(), but only for one layer/type
+    has_object(obj: GameObject) -> bool
+    get_object_count() -> int
     
     add_object(obj: GameObject)
     remove_object(obj: GameObject)
+        - both report the cell to PhysicsManager.update_crowded()
+        - both refresh the cell
 
 '''
 
 class Cell():
+    __slots__ = ("game", "x", "y", "_type", "_entities", "_objects",
+                 "_objectsView", "_entitiesView", "_tanksView", "_bulletsView", "_itemVersion", "_version")
     _type: Item | None
-    _objects: list[GameObject]
+    _entities: dict[Entity, None]
+    _objects: dict[GameObject, None]
+    _objectsView: tuple[GameObject, ...] | None
+    _entitiesView: tuple[Entity, ...] | None
+    _tanksView: tuple[Tank, ...] | None
+    _bulletsView: tuple[Bullet, ...] | None
+    _itemVersion: int
+    _version: int
     def __init__(self, game: GameField, x: int, y: int):
         self.game = game
         self.x = x
@@ -45,31 +84,91 @@ class Cell():
         game[y, x] = self
 
         self._type = None
-        self._objects = []
+        self._entities = {}
+        self._objects = {}
+        self._objectsView = ()
+        self._entitiesView = ()
+        self._tanksView = ()
+        self._bulletsView = ()
+        self._itemVersion = 0
+        self._version = 0
 
     def get_item(self) -> Item | None:
         return self._type
 
-    def get_objects(self) -> list[GameObject]:
-        return self._objects.copy()
+    def get_item_version(self) -> int:
+        return self._itemVersion
+
+    def refresh_item(self):
+        self._itemVersion += 1
+        self._version += 1
+
+    def get_version(self) -> int:
+        return self._version
+
+    def refresh(self):
+        self._version += 1
+
+    def get_objects(self) -> tuple[GameObject, ...]:
+        view = self._objectsView
+        if view is None:
+            view = self._objectsView = tuple(self._objects)
+        return view
+
+    def get_entities(self) -> tuple[Entity, ...]:
+        view = self._entitiesView
+        if view is None:
+            view = self._entitiesView = tuple(self._entities)
+        return view
+
+    def tanks(self) -> tuple[Tank, ...]:
+        view = self._tanksView
+        if view is None:
+            view = self._tanksView = tuple(e for e in self._entities if isinstance(e, Tank))
+        return view
+
+    def bullets(self) -> tuple[Bullet, ...]:
+        view = self._bulletsView
+        if view is None:
+            view = self._bulletsView = tuple(e for e in self._entities if isinstance(e, Bullet))
+        return view
+
+    def has_object(self, obj: GameObject) -> bool:
+        return obj in self._objects
+
+    def get_object_count(self) -> int:
+        return len(self._objects)
     
     def add_object(self, obj: GameObject):
+        if obj in self._objects:
+            return
+        
         if isinstance(obj, Item):
             if self._type is not None:
                 raise ValueError("Cell can only have one Item type!")
             self._type = obj
-
-        if obj in self._objects:
-            return
-        self._objects.append(obj)
+            self._itemVersion += 1
+        elif isinstance(obj, Entity):
+            self._entities[obj] = None
+            self._entitiesView = self._tanksView = self._bulletsView = None
+
+        self._objects[obj] = None
+        self._objectsView = None
+        self._version += 1
+        self.game.physics.update_crowded(self)
     
     def remove_object(self, obj: GameObject):
-        if obj == self._type:
-            self._type = None
-
         if obj not in self._objects:
             return
-        self._objects.remove(obj)
-
-
-    
\ No newline at end of file
+        
+        if obj is self._type:
+            self._type = None
+            self._itemVersion += 1
+        elif obj in self._entities:
+            del self._entities[obj]
+            self._entitiesView = self._tanksView = self._bulletsView = None
+
+        del self._objects[obj]
+        self._objectsView = None
+        self._version += 1
+        self.game.physics.update_crowded(self)
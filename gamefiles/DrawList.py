@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+'''
+Z-ordered list of sprites to draw (used by Renderer)
+NOTE: nothing is allocated per item, buckets are reused every frame
+
+- one bucket per zIndex, drawn from lowest to highest zIndex (no sorting)
+- within a zIndex, items are drawn in the order they were added, then queued items in the order they were queued
+    - same order as a stable sort by zIndex
+
+DrawBucket
+    xs: list[float]
+    ys: list[float]
+    indices: list[tuple[int, int]]
+        - parallel arrays, only the first "count" entries are valid
+    count: int
+
+    add(x: float, y: float, index: tuple[int, int])
+
+DrawList
+    Z_INDICES: tuple[int, ...]
+        - zIndices with a bucket from the start
+        - any other zIndex gets its own bucket the first time it's used
+
+    add(x: float, y: float, index: tuple[int, int], z_index: int)
+    queue(x: float, y: float, index: tuple[int, int], z_index: int)
+        - same as add(), but kept separately (see Renderer.render_z())
+
+    get_z_indices() -> tuple[int, ...]
+        - sorted
+    get(z_index: int) -> tuple[DrawBucket, DrawBucket]
+        - (added, queued) items of zIndex
+    get_count() -> int
+
+    clear()
+        - removes added items
+    clear_queue()
+        - removes queued items
+'''
+
+class DrawBucket:
+    __slots__ = ("xs", "ys", "indices", "count")
+    xs: list[float]
+    ys: list[float]
+    indices: list[tuple[int, int]]
+    count: int
+    def __init__(self):
+        self.xs = []
+        self.ys = []
+        self.indices = []
+        self.count = 0
+
+    def add(self, x: float, y: float, index: tuple[int, int]):
+        n = self.count
+        if n < len(self.xs):
+            self.xs[n] = x
+            self.ys[n] = y
+            self.indices[n] = index
+        else:
+            self.xs.append(x)
+            self.ys.append(y)
+            self.indices.append(index)
+        self.count = n + 1
+
+
+class DrawList:
+    __slots__ = ("_buckets", "_zIndices")
+    Z_INDICES = (-3, -2, -1, 0, 1, 2, 3, 4, 5, 69)
+    _buckets: dict[int, tuple[DrawBucket, DrawBucket]]
+    _zIndices: tuple[int, ...]
+    def __init__(self):
+        self._buckets = {z: (DrawBucket(), DrawBucket()) for z in DrawList.Z_INDICES}
+        self._zIndices = DrawList.Z_INDICES
+
+    def add(self, x: float, y: float, index: tuple[int, int], z_index: int):
+        self.get(z_index)[0].add(x, y, index)
+
+    def queue(self, x: float, y: float, index: tuple[int, int], z_index: int):
+        self.get(z_index)[1].add(x, y, index)
+
+    def get_z_indices(self) -> tuple[int, ...]:
+        return self._zIndices
+
+    def get(self, z_index: int) -> tuple[DrawBucket, DrawBucket]:
+        buckets = self._buckets.get(z_index)
+        if buckets is None:
+            buckets = self._buckets[z_index] = (DrawBucket(), DrawBucket())
+            self._zIndices = tuple(sorted(self._buckets))
+        return buckets
+
+    def get_count(self) -> int:
+        return sum(added.count + queued.count for added, queued in self._buckets.values())
+
+    def clear(self):
+        for added, _ in self._buckets.values():
+            added.count = 0
+
+    def clear_queue(self):
+        for _, queued in self._buckets.values():
+            queued.count = 0
@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gamefiles.GameField import GameField
+    from objects.GameObject import GameObject
+
+'''
+Pool of sprite effects (one per Renderer, see Renderer.effects)
+NOTE: effects are plain records, prefer spawn() over Renderer.render_custom() closures for sprite effects !!
+
+Every effect is drawn through Renderer.render_z() (so dirty mode tracks it), all of them in one loop (update())
+Effect records are reused, nothing is allocated per effect once the pool is warm
+Effects are drawn in the order they were spawned
+
+Effect
+    sequence: tuple[tuple[tuple[int, int], float], ...]
+        - (index, lastFrame) pairs, index is assetindex
+        - the first sprite whose lastFrame >= the effect's frame is drawn (frames start at 1)
+    x: float
+    y: float
+        - WINDOW coords (see Renderer.render_z())
+    source: GameObject | None
+        - if set, the effect follows the cell of source as long as source.id == sourceId
+            - (pooled Bullets get a new id when reused)
+    sourceId: int
+    startFrame: int
+        - frame of the pool the effect was spawned at
+    duration: float
+        - in frames, the effect is drawn while its frame <= duration
+    zIndex: int
+    priority: int
+
+EffectPool
+    cap: int
+        - max running effects
+    dropped: int
+        - effects dropped because the pool was full (since start)
+
+    spawn(sequence: tuple[tuple[tuple[int, int], float], ...], x: float, y: float, duration: float, z_index: int,
+          priority: int = 0, source: GameObject | None = None) -> Effect | None
+        - if the pool is full, the oldest effect with the lowest priority (lower than priority) is dropped to make room
+        - returns None if the effect itself was dropped
+    stop(effect: Effect)
+    clear()
+    get_count() -> int
+        - running effects
+
+    ---------------------------------
+    INTERNALS
+
+    update()
+        - called by Renderer.post_draw_grid()
+        - advances every effect by 1 frame, draws them (queued, see Renderer.render_z()) and frees finished ones
+'''
+
+class Effect:
+    __slots__ = ("sequence", "x", "y", "source", "sourceId", "startFrame", "duration", "zIndex", "priority")
+    sequence: tuple[tuple[tuple[int, int], float], ...]
+    x: float
+    y: float
+    source: GameObject | None
+    sourceId: int
+    startFrame: int
+    duration: float
+    zIndex: int
+    priority: int
+
+
+class EffectPool:
+    def __init__(self, game: GameField, cap: int = 256):
+        self.game = game
+        self.cap = cap
+        self.dropped = 0
+        self._frame = 0
+        self._active = list[Effect]()
+        self._free = list[Effect]()
+
+    def spawn(self, sequence: tuple[tuple[tuple[int, int], float], ...], x: float, y: float, duration: float, z_index: int,
+              priority: int = 0, source: GameObject | None = None) -> Effect | None:
+        active = self._active
+        if len(active) >= self.cap:
+            lowest = None
+            for effect in active:
+                if effect.priority < priority and (lowest is None or effect.priority < lowest.priority):
+                    lowest = effect
+            self.dropped += 1
+            if lowest is None:
+                return None
+            self.stop(lowest)
+
+        effect = self._free.pop() if len(self._free) > 0 else Effect()
+        effect.sequence = sequence
+        effect.x = x
+        effect.y = y
+        effect.source = source
+        effect.sourceId = source.id if source is not None else -1
+        effect.startFrame = self._frame
+        effect.duration = duration
+        effect.zIndex = z_index
+        effect.priority = priority
+        active.append(effect)
+        return effect
+
+    def stop(self, effect: Effect):
+        if effect not in self._active:
+            return
+        self._active.remove(effect)
+        effect.source = None
+        self._free.append(effect)
+
+    def clear(self):
+        for effect in self._active:
+            effect.source = None
+        self._free.extend(self._active)
+        self._active.clear()
+
+    def get_count(self) -> int:
+        return len(self._active)
+
+    # ---------------------------------
+    # internal
+    def update(self):
+        self._frame += 1
+        frame = self._frame
+        game = self.game
+        render_z = game.renderer.render_z
+        active = self._active
+        n = 0
+        for effect in active:
+            age = frame - effect.startFrame
+            if age > effect.duration:
+                effect.source = None
+                self._free.append(effect)
+                continue
+
+            source = effect.source
+            if source is not None and source.id == effect.sourceId:
+                cell = source.get_cell()
+                effect.x = game.x(cell.x)
+                effect.y = game.y(cell.y)
+
+            for index, last_frame in effect.sequence:
+                if age <= last_frame:
+                    render_z(effect.x, effect.y, index, effect.zIndex)
+                    break
+            active[n] = effect
+            n += 1
+        del active[n:]
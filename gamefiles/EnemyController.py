@@ -1,7 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, get_args, Callable
-
-import random
+from random import Random
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
@@ -23,40 +22,41 @@ EnemyController:
 
 '''
 
-def random_interval() -> float:
-    return random.random() * 2
+def random_interval(rng: Random) -> float:
+    return rng.random() * 2
 
 class EnemyController():
     _moveOnce: Callable[[int, int], None] | None
     def __init__(self, game: GameField, tank: Tank):
         self.game = game
         self.tank = tank
+        rng = game.rng
 
-
-        self._rotateInterval = random_interval()
+        self._rotateInterval = random_interval(rng)
         self._lastRotateTime = 0
 
-        self._moveInterval = random_interval()
+        self._moveInterval = random_interval(rng)
         self._lastMoveTime = 0
         self._moveCount = 0
 
-        self._fireInterval = random_interval()
+        self._fireInterval = random_interval(rng)
         self._lastFireTime = 0
         self._fireCount = 0
 
     def update(self, frame_count: int):
+        rng = self.game.rng
 
         # rotate
         if frame_count > self._lastRotateTime + (self.game.FPS * self._rotateInterval):
             self._lastRotateTime = frame_count
-            self._rotateInterval = random_interval()
+            self._rotateInterval = random_interval(rng)
 
-            self.tank.set_orientation(random.choice(get_args(Orientation)))
+            self.tank.set_orientation(rng.choice(get_args(Orientation)))
 
         # move
         if self._moveCount <= 0 and frame_count > self._lastMoveTime + (self.game.FPS * self._moveInterval):
             self._lastMoveTime = frame_count
-            self._moveCount = random.randint(1, 5)
+            self._moveCount = rng.randint(1, 5)
             self.tank.start_moving()
 
             def moveOnce(x: int, y: int):
@@ -65,7 +65,7 @@ class EnemyController():
 
                 if self._moveCount <= 0:
                     self._lastMoveTime = frame_count
-                    self._moveInterval = random_interval()
+                    self._moveInterval = random_interval(rng)
                     self.tank.stop_moving()
                     self.tank.onMove.remove_listener(moveOnce)
                     
@@ -75,7 +75,7 @@ class EnemyController():
         if self._fireCount > 0:
             self.tank.fire_bullet()
         elif frame_count > self._lastFireTime + (self.game.FPS * self._fireInterval):
-            self._fireCount = random.randint(1, 5)
+            self._fireCount = rng.randint(1, 5)
 
             def fireOnce(bullet: Bullet):
 
@@ -83,7 +83,7 @@ class EnemyController():
 
                 if self._fireCount <= 0:
                     self._lastFireTime = frame_count
-                    self._fireInterval = random_interval()
+                    self._fireInterval = random_interval(rng)
                     self.tank.onBulletFired.remove_listener(fireOnce)
 
             self.tank.onBulletFired.add_listener(fireOnce)
@@ -1,16 +1,14 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from collections.abc import Callable
-from random import choice
 
-import pyxel
+from misc.backend import pyxel
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
     from gamefiles.Cell import Cell
 
 from misc.util import GameState, orientation_to_move_vector
-from objects.Tank import Tank
 
 from resources.controls import DEBUG_CONTROLS
 
@@ -31,6 +29,10 @@ CHEAT CODES (Hold CTRL key):
         - keep yourself safe
     powerup
         - spawn a random powerup
+    profiler
+        - toggle the frame profiler overlay
+    dirty
+        - cycle the Renderer dirty mode: off -> on -> on + overlay -> off
     
         
     ???
@@ -81,11 +83,9 @@ def _(game: GameField):
     for r in range(game.r):
         for c in range(game.c):
             cell = game[r, c]
-            for obj in cell.get_objects():
-
-                if isinstance(obj, Tank):
-                    if obj.team == "enemy":
-                        obj.destroy()
+            for obj in cell.tanks():
+                if obj.team == "enemy":
+                    obj.destroy()
 
 @create(c="win")
 def _(game: GameField):
@@ -105,14 +105,28 @@ def _(game: GameField):
                 empty_cells.append(cell)
 
     if len(empty_cells) > 0:
-        chosen_cell = choice(empty_cells)
-        game.powerupFactory.powerup(x=chosen_cell.x, y=chosen_cell.y, powerup_type=choice(game.powerupFactory.get_powerup_types()))
+        chosen_cell = game.rng.choice(empty_cells)
+        game.powerupFactory.powerup(x=chosen_cell.x, y=chosen_cell.y, powerup_type=game.rng.choice(game.powerupFactory.get_powerup_types()))
 
 
 @create(c="test")
 def _(game: GameField):
     game.start_stage("_TEST")
 
+@create(c="profiler")
+def _(game: GameField):
+    game.profiler.toggle_overlay()
+
+@create(c="dirty")
+def _(game: GameField):
+    renderer = game.renderer
+    if not renderer.dirtyMode:
+        renderer.set_dirty_mode(True)
+    elif not renderer.dirtyOverlay:
+        renderer.set_dirty_mode(True, overlay=True)
+    else:
+        renderer.set_dirty_mode(False)
+
 
 
 
@@ -1,6 +1,6 @@
-from collections.abc import Callable
+from random import Random
 
-import pyxel
+from misc.backend import pyxel, use_null_backend, NullPyxel
 
 from pyxelgrid import PyxelGrid
 from gamefiles.Cell import Cell
@@ -9,13 +9,16 @@ from gamefiles.PhysicsManager import PhysicsManager
 from gamefiles.Renderer import Renderer
 from gamefiles.SoundManager import SoundManager
 from gamefiles.GOD import God
+from gamefiles.Profiler import Profiler
+from gamefiles.LeakDetector import LeakDetector
 
 from gamefiles.TankFactory import TankFactory
 from gamefiles.PowerupFactory import PowerupFactory
+from gamefiles.BulletPool import BulletPool
 
 from gamefiles.StageFile import Stage
 from misc.util import GameState
-from gamefiles.Signal import Signal
+from gamefiles.Signal import Signal, SignalArena
 
 from objects.GameObject import GameObject
 
@@ -28,13 +31,41 @@ from resources.controls import CONTROLS
 the World class
 
 GameField
+    ARGS:
+        - fps: int
+        - r: int
+        - c: int
+        - dim: int
+        - headless: bool = False
+            - if True, no window is opened and pyxel is swapped for a NullPyxel backend (see misc/backend.py)
+            - the game is then advanced manually through step()
+        - seed: int | None = None
+            - default seed for every start_stage() (random if None)
+
     FPS: int
+    headless: bool
+    seed: int | None
+    rng: Random
+        - the world's only source of randomness (AI, spawns, powerups, etc.)
+        - NOTE: do not use the global random module for simulation !!
+    stageSeed: int
+        - seed used by the current stage (pass to start_stage() to replay it)
 
     physics: PhysicsManager
     renderer: Renderer
     sounds: SoundManager
     stage: Stage
     tankFactory: TankFactory
+    bulletPool: BulletPool
+        - create Bullets through this (recycles destroyed ones)
+    profiler: Profiler
+        - per-phase update()/draw timings and live counts (disabled by default)
+    signalArena: SignalArena
+        - tracks every Signal and releases destroyed ones in bulk (see gamefiles/Signal.py)
+        - Signal destroy is handled asynchronously (at the end of the frame in game loop)
+        - this is to let Signals still fire for at most 1 frame after GameObject is destroyed
+    leakDetector: LeakDetector
+        - reports listeners/destroyed objects surviving stage cleanups (disabled by default)
 
     maxStages: int
         - must be manually changed
@@ -46,11 +77,16 @@ GameField
     onPreObjectUpdate: Signal[[int], None]
     onPostObjectUpdate: Signal[[int], None]
     onPostPhysicsUpdate: Signal[[int], None]
+
+    get_objects() -> list[GameObject]
+        - every GameObject currently in the game (not destroyed), in id (creation) order
     
     start_stage(stage: str,
                 lives: int | None = None,
                 remaining_enemy_spawns: int | None = None,
-                copy_modifiers: bool = False)
+                copy_modifiers: bool = False,
+                seed: int | None = None)
+        - reseeds rng with seed (or GameField's seed, or a random one if both are None)
         - cleans the game field up
         - loads the stage with path "resources/stages/{stage}.txt"
         - stage settings is based on STAGE_SETTINGS by default, but can be overriden
@@ -73,34 +109,63 @@ GameField
             - EnemyController updates
             - stage-specific updates
             - GameObject updates
+                - in id (creation) order, each object at most once
+                - only objects that override update() or currently have modifiers
+                - objects created during this step are first updated next frame
             - physics
             - signal destroy processing
+            - bullets destroyed this frame are made available to bulletPool
 
             - GameState check (WIN/LOSE)
 
+    step(frames: int = 1, render: bool = False)
+        - HEADLESS ONLY
+        - runs update() (and the whole draw pass if render is True) then advances the frame count
+        - runs as fast as the CPU allows, not bound to FPS
+
     ---------------------------------
     # INTERNALS
 
-    queue_signal_destroy(f: Callable[[], None])
-        - all Signals call this function to tag them for cleanup
-        - Signal destroy is handled asynchronously (at the end of the frame in game loop)
-        - this is to let Signals still fire for at most 1 frame after GameObject is destroyed
+    register_object(obj: GameObject)
+        - called by GameObject once it's actually added (right before onObjectAdded)
+    unregister_object(obj: GameObject)
+        - called by GameObject on destroy
+        - notifies Renderer.object_destroyed() if obj was registered
+    refresh_object(obj: GameObject)
+        - called by GameObject whenever its modifiers change
+        - (re)decides if obj has to be visited in the GameObject update step
+        - objects that stop needing updates keep their (None) entry until destroyed
+            - so the registry stays in id order without sorting (ids only grow, re-added objects keep their place)
 
 '''
 
 class GameField(PyxelGrid[Cell]):
-    def __init__(self, fps: int, r: int = 15, c: int = 15, dim: int = 16):
+    _nullBackend: NullPyxel | None
+    def __init__(self, fps: int, r: int = 15, c: int = 15, dim: int = 16, headless: bool = False, seed: int | None = None):
         super().__init__(r, c, dim=dim)
         self.FPS = fps
+        self.headless = headless
+        self.seed = seed
+        self._nullBackend = None
+        if headless:
+            self._nullBackend = use_null_backend(width=c * dim, height=r * dim)
+            self.init()
+            return
         self.run(title="Battle Tanks Bootleg:tm:", fps=fps)
 
     def init(self):
         # internals
+        self.signalArena = SignalArena()
+        self._objects = dict[int, GameObject]()
+        self._updatables = dict[int, GameObject | None]()
+            # (id order, None if the object doesn't need updating right now)
+        self.leakDetector = LeakDetector(self) # (before any GameObject can be destroyed)
         for r in range(self.r):
             for c in range(self.c):
                 Cell(self, r, c)
-        self._signalDestroyQueue = list[Callable[[], None]]()
         self._restartDebounce = False
+        self.stageSeed = self.seed if self.seed is not None else Random().getrandbits(32)
+        self.rng = Random(self.stageSeed)
 
         self.stage = Stage(self)
         self.physics = PhysicsManager(self)
@@ -108,7 +173,9 @@ class GameField(PyxelGrid[Cell]):
         self.sounds = SoundManager(self)
         self.tankFactory = TankFactory(self)
         self.powerupFactory = PowerupFactory(self)
+        self.bulletPool = BulletPool(self)
         self.GOD = God(self)
+        self.profiler = Profiler(self)
         pyxel.load("resources/resource.pyxres")
 
 
@@ -136,10 +203,18 @@ class GameField(PyxelGrid[Cell]):
         self._currentGameState = state
         self.onStateChanged.fire(state)
     
-    def start_stage(self, stage: str, lives: int | None = None, remaining_enemy_spawns: int| None = None, copy_modifiers: bool = False):
+    def get_objects(self) -> list[GameObject]:
+        return list(self._objects.values())
+    
+    def start_stage(self, stage: str, lives: int | None = None, remaining_enemy_spawns: int| None = None, copy_modifiers: bool = False, seed: int | None = None):
         if stage not in STAGE_SETTINGS.keys():
             raise ValueError(f"Please specify stage settings for {stage}!")
 
+        if seed is None:
+            seed = self.seed if self.seed is not None else Random().getrandbits(32)
+        self.stageSeed = seed
+        self.rng.seed(seed)
+
         self.set_game_state(GameState.GENERATING)
         # stage="_TEST"
         was_destroyed = self.stage.get_player().tank.is_destroyed()
@@ -200,8 +275,16 @@ class GameField(PyxelGrid[Cell]):
 
     
     def update(self):
+        self.profiler.begin_frame()
+        self._update()
+        self.profiler.end_frame()
+
+    def _update(self):
+        profiler = self.profiler
+
         # -1 GOD
         self.GOD.update()
+        profiler.mark("GOD")
 
         # 0 game state
         if pyxel.btn(CONTROLS["restart"]["btn"]):
@@ -228,6 +311,7 @@ class GameField(PyxelGrid[Cell]):
             self.set_game_state(GameState.LOSE)
         elif self.stage.get_total_enemy_count() == 0:
             self.set_game_state(GameState.WIN)
+        profiler.mark("state")
 
         # 1 input handling
         player = self.stage.get_player()
@@ -237,42 +321,87 @@ class GameField(PyxelGrid[Cell]):
 
         if not player.tank.is_destroyed():
             player.update(pyxel.frame_count)
+        profiler.mark("input")
         
         # 2 enemy
         enemies = self.stage.get_enemies()
         for enemy in enemies:
             enemy.update(pyxel.frame_count)
+        profiler.mark("enemy")
 
         # 3 stage
         self.stage.update(pyxel.frame_count)
+        profiler.mark("stage")
 
         self.onPreObjectUpdate.fire(pyxel.frame_count)
 
         # 4 game objects
-        [obj.main_update(pyxel.frame_count) for r in range(self.r) for c in range(self.c) for obj in self[r, c].get_objects()]
+        frame_count = pyxel.frame_count
+        updatables = self._updatables
+        for object_id in [object_id for object_id, obj in updatables.items() if obj is not None]:
+            obj = updatables.get(object_id)
+            if obj is not None: # destroyed/no longer needs updating since
+                obj.main_update(frame_count)
 
         self.onPostObjectUpdate.fire(pyxel.frame_count)
+        profiler.mark("objects")
 
         # 5 physics
         self.physics.update(pyxel.frame_count)
 
         self.onPostPhysicsUpdate.fire(pyxel.frame_count)
+        profiler.mark("physics")
 
         # 6 process signal destroy
-        [f() for f in self._signalDestroyQueue]
-        self._signalDestroyQueue = []
+        profiler.count("signalDestroyQueue", self.signalArena.get_pending_count())
+        self.signalArena.sweep()
+        self.bulletPool.flush()
+        profiler.mark("signalDestroy")
+
+    def step(self, frames: int = 1, render: bool = False):
+        if self._nullBackend is None:
+            raise ValueError("step() is only available in headless mode!")
+        for _ in range(frames):
+            self.update()
+            if render:
+                self.pre_draw_grid()
+                for i in range(self.r):
+                    for j in range(self.c):
+                        self.draw_cell(i, j, self.x(j), self.y(i))
+                self.post_draw_grid()
+            self._nullBackend.frame_count += 1
 
     def draw_cell(self, i: int, j: int, x: int, y: int) -> None:
         self.renderer.draw_cell(pyxel.frame_count, i, j, x, y)
 
     def pre_draw_grid(self):
+        self.profiler.begin_draw()
         self.renderer.pre_draw_grid()
+        self.profiler.mark("pre_draw_grid")
         
     def post_draw_grid(self):
+        self.profiler.mark("draw_cell")
         self.renderer.post_draw_grid()
+        self.profiler.mark("post_draw_grid")
+        self.profiler.end_draw()
 
 
     # ---------------------------------
     # INTERNAL
-    def queue_signal_destroy(self, f: Callable[[], None]):
-        self._signalDestroyQueue.append(f)
+    def register_object(self, obj: GameObject):
+        self._objects[obj.id] = obj
+        self.refresh_object(obj)
+
+    def unregister_object(self, obj: GameObject):
+        if self._objects.pop(obj.id, None) is None:
+            return
+        self._updatables.pop(obj.id, None)
+        self.renderer.object_destroyed(obj)
+
+    def refresh_object(self, obj: GameObject):
+        if obj.id not in self._objects:
+            return
+        if len(obj._modifiers) != 0 or type(obj).update is not GameObject.update:
+            self._updatables[obj.id] = obj
+        elif obj.id in self._updatables:
+            self._updatables[obj.id] = None
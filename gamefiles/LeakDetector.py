@@ -0,0 +1,105 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+from weakref import WeakSet, WeakKeyDictionary
+import gc
+
+if TYPE_CHECKING:
+    from gamefiles.GameField import GameField
+    from gamefiles.Signal import Signal
+    from objects.GameObject import GameObject
+
+'''
+Singleton for finding listener leaks (debugging)
+Disabled by default (every call returns immediately)
+Checked at the start of every Stage.cleanup():
+    - everything destroyed during the stage before the previous cleanup should be unreachable by now
+
+LeakDetector
+    enabled: bool
+    reports: list[dict[str, Any]]
+        - one report per check, oldest first (keeps the last "maxReports")
+        - REPORT:
+            stage: str
+                - stage being cleaned up
+            signals: list[dict[str, Any]]
+                - every live Signal that survived the previous cleanup and has listeners
+                - listeners: int
+                - growth: int
+                    - listeners gained since the previous check
+                - names: list[str]
+                    - qualified names of the listeners
+            leakedObjects: list[str]
+                - destroyed GameObjects from two stages ago that are still reachable
+                    (pooled Bullets waiting for reuse are not counted)
+    maxReports: int
+
+    enable()
+    disable()
+    get_last_report() -> dict[str, Any] | None
+
+    ---------------------------------
+    INTERNALS
+
+    track_destroyed(obj: GameObject)
+        - called by GameObject on destroy
+    check()
+        - called by Stage.cleanup()
+'''
+
+class LeakDetector:
+    def __init__(self, game: GameField, max_reports: int = 16):
+        self.game = game
+        self.enabled = False
+        self.reports = list[dict[str, Any]]()
+        self.maxReports = max_reports
+        self._destroyed: WeakSet[GameObject] = WeakSet()
+        self._previousDestroyed: WeakSet[GameObject] = WeakSet()
+        self._seenSignals: WeakKeyDictionary[Signal[..., object], int] = WeakKeyDictionary()
+
+    def enable(self):
+        self.enabled = True
+        self.game.signalArena.set_tracking(self, True)
+    def disable(self):
+        self.enabled = False
+        self.game.signalArena.set_tracking(self, False)
+
+    def get_last_report(self) -> dict[str, Any] | None:
+        if len(self.reports) == 0:
+            return None
+        return self.reports[-1]
+
+    # ---------------------------------
+    # internal
+    def track_destroyed(self, obj: GameObject):
+        if not self.enabled:
+            return
+        self._destroyed.add(obj)
+
+    def check(self):
+        if not self.enabled:
+            return
+        gc.collect()
+
+        pooled = self.game.bulletPool.get_pooled()
+        leaked = [f"{type(obj).__name__}#{obj.id}" for obj in self._previousDestroyed if obj.is_destroyed() and obj not in pooled]
+        self._previousDestroyed = self._destroyed
+        self._destroyed = WeakSet()
+
+        signals = list[dict[str, Any]]()
+        seen = self._seenSignals
+        for signal in self.game.signalArena.get_signals():
+            count = signal.get_listener_count()
+            if signal in seen and count > 0:
+                signals.append({
+                    "listeners": count,
+                    "growth": count - seen[signal],
+                    "names": [getattr(f, "__qualname__", repr(f)) for f in signal.get_listeners()],
+                })
+            seen[signal] = count
+
+        self.reports.append({
+            "stage": self.game.stage.name,
+            "signals": signals,
+            "leakedObjects": leaked,
+        })
+        del self.reports[:-self.maxReports]
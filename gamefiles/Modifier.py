@@ -53,9 +53,25 @@ Modifier
         - if returns bool, overrides object.can_collide()
     can_touch() -> bool | None
         - if returns bool, overrides object.can_touch()
+
+    NOTE: unspecified functions default to the shared no-ops below (no_init, no_update, etc.)
+        - objects skip calling them (see GameObject.main_update())
 '''
 
+def no_init(self: Modifier) -> None:
+    return None
+def no_update(self: Modifier, frame_count: int) -> None:
+    return None
+def no_destroy(self: Modifier) -> None:
+    return None
+def no_can_collide(self: Modifier, other: GameObject) -> bool | None:
+    return None
+def no_can_touch(self: Modifier, other: GameObject) -> bool | None:
+    return None
+
 class Modifier:
+    __slots__ = ("game", "owner", "type", "priority", "stageTransferrable", "data",
+                 "init", "update", "destroy", "can_collide", "can_touch", "_o")
     owner: GameObject
     init: Callable[[Modifier], None]
     update: Callable[[Modifier, int], None]
@@ -79,11 +95,11 @@ class Modifier:
         self.stageTransferrable = stage_transferrable
         self.data = data if data is not None else dict[str, Any]()
 
-        self.init = init if init is not None else lambda _: None
-        self.update = update if update is not None else lambda _, f: None
-        self.destroy = destroy if destroy is not None else lambda _: None
-        self.can_collide = can_collide if can_collide is not None else lambda _, o: None
-        self.can_touch = can_touch if can_touch is not None else lambda _, o: None
+        self.init = init if init is not None else no_init
+        self.update = update if update is not None else no_update
+        self.destroy = destroy if destroy is not None else no_destroy
+        self.can_collide = can_collide if can_collide is not None else no_can_collide
+        self.can_touch = can_touch if can_touch is not None else no_can_touch
 
         self._o = None
     
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from types import MappingProxyType
+from heapq import heappush, heappop
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
@@ -13,88 +16,224 @@ from misc.util import orientation_to_move_vector
 '''
 Singleton for managing physics and Entity movement
 Entity speed/movement is one cell every certain number of frames
+Entities faster than FPS (speed > FPS) move multiple cells per frame in one-cell sub-steps
 Negative speed values is same as 0 (since Orientation determines vector direction anyway)
 can_collide(), collided_with() and touched() are called on both for each other
 
+Entities are registered through GameField.onObjectAdded and unregistered through their onDestroy
+Cells holding two or more objects are tracked as "crowded" (reported by Cell itself)
+Cost per frame scales with moving/crowded things instead of the grid size
+
+MOVEMENT SCHEDULE:
+    - every moving entity has a MoveRecord and a heap entry keyed on its next due frame (lastMoveFrame + FPS/speed)
+    - rescheduled whenever onSpeedChanged fires and after every frame it was due
+    - only entities that are due are visited (in registration order)
+    - entities that couldn't move (blocked/OOB) stay due and are retried every frame (without going back into the heap)
+    - entities with speed 0 are not in the heap at all
+    - entities with speed > FPS are due every frame and accumulate speed/FPS cells of credit per frame
+        - the whole part of the credit is the number of sub-steps this frame (the rest carries over)
+        - a sub-step that is blocked (or goes OOB) ends the entity's movement for the frame
+
 init()
     - called on GameField initialization
+    - registers entities already on the grid
 update()
     - called every game loop
     - ORDER:
-        - SAME-CELL COLLISION
+        - SAME-CELL COLLISION (crowded cells only, in row-major order)
             - call collided_with(), touched() on objects in same cell
                 (this is for if there's somehow two GameObjects that were able to move into each other even if collidable)
         
         - MOVEMENT COLLISION
-            - store entities that need to move (+ trigger OOB)
-            - store entities that CAN move, and move them (+ trigger collision if can't)
-            - trigger touched after all
+            - store entities that need to move, popped from the schedule
+            - move_step() for all of them, then again for entities with sub-steps left, until none are left
+        - every collision/touch pair is handled at most once per frame
+
+collisions: Mapping[tuple[int, int], tuple[GameObject, GameObject]]
+touches: Mapping[tuple[int, int], tuple[GameObject, GameObject]]
+    - read-only views of this frame's contacts (valid after update() until the next update())
+    - keyed by pair_key()
 
+has_collided(a: GameObject, b: GameObject) -> bool
+has_touched(a: GameObject, b: GameObject) -> bool
+    - if a and b collided/touched this frame
 
+pair_key(a: GameObject, b: GameObject) -> tuple[int, int]
+    - order-independent key for a pair of objects (ordered ids)
 
+---------------------------------
+INTERNALS
 
+move_step(entities: list[Entity], frame_count: int) -> list[Entity]
+    - moves every entity one cell towards its orientation
+    - ORDER:
+        - store target cells (+ trigger OOB)
+        - store entities that CAN move, and move them (+ trigger collision if can't)
+        - trigger touched after all (including entities moving towards each other)
+    - returns entities that moved and weren't destroyed
+register(obj: GameObject)
+    - starts tracking obj if it's an Entity (GameField.onObjectAdded listener)
+    - stops tracking (and stops listening to it) once it's destroyed
+schedule(record: MoveRecord)
+    - (re)computes record's due frame and pushes it into the heap
+    - older heap entries of the record are ignored (versioned)
+update_crowded(cell: Cell)
+    - called by Cell whenever an object is added/removed
 '''
 
+class MoveRecord:
+    __slots__ = ("entity", "seq", "lastMoveFrame", "version", "credit", "steps")
+    def __init__(self, entity: Entity, seq: int):
+        self.entity = entity
+        self.seq = seq
+        self.lastMoveFrame = -6969
+        self.version = 0
+        self.credit = 0.0
+        self.steps = 0
+
+def _seq(entry: tuple[int, MoveRecord]) -> int:
+    return entry[1].seq
+
+def _row_major(cell: Cell) -> tuple[int, int]:
+    return (cell.y, cell.x)
+
+def pair_key(a: GameObject, b: GameObject) -> tuple[int, int]:
+    a_id = a.id
+    b_id = b.id
+    return (a_id, b_id) if a_id < b_id else (b_id, a_id)
+
 class PhysicsManager:
     def __init__(self, game: GameField):
         self.game = game
-        self._entities: dict[Entity, dict[str, Any]] = {}
+        self._entities: dict[Entity, MoveRecord] = {}
+        self._crowded: dict[Cell, None] = {}
+        self._schedule: list[tuple[float, int, int, MoveRecord]] = []
+        self._retry: list[tuple[int, MoveRecord]] = []
+        self._seq = 0
+
+        self._collisions: dict[tuple[int, int], tuple[GameObject, GameObject]] = {}
+        self._touches: dict[tuple[int, int], tuple[GameObject, GameObject]] = {}
+        self.collisions: Mapping[tuple[int, int], tuple[GameObject, GameObject]] = MappingProxyType(self._collisions)
+        self.touches: Mapping[tuple[int, int], tuple[GameObject, GameObject]] = MappingProxyType(self._touches)
     
     def init(self):
-        def reset():
-            self._entities = {}
-        self.game.stage.onStageGenerated.add_listener(reset)
-
-    def update(self, frame_count: int):
-        
-        # same-cell collision
-        collision_pairs: list[set[GameObject]] = []
-        touched_pairs: list[set[GameObject]] = []
         for r in range(self.game.r):
             for c in range(self.game.c):
                 cell = self.game[r, c]
-                
+                self.update_crowded(cell)
                 for obj in cell.get_objects():
+                    self.register(obj)
+        self.game.onObjectAdded.add_listener(self.register)
+
+    def register(self, obj: GameObject):
+        if not isinstance(obj, Entity):
+            return
+        if obj in self._entities or obj.is_destroyed():
+            return
+        self._seq += 1
+        record = MoveRecord(obj, self._seq)
+        self._entities[obj] = record
+        self.schedule(record)
+
+        def reschedule(speed: float):
+            self.schedule(record)
+        obj.onSpeedChanged.add_listener(reschedule)
+        def unregister():
+            self._entities.pop(obj, None)
+            record.version += 1
+            obj.onSpeedChanged.remove_listener(reschedule)
+        obj.onDestroy.add_listener(unregister)
+
+    def schedule(self, record: MoveRecord):
+        record.version += 1
+        entity = record.entity
+        if entity.speed == 0 or entity.is_destroyed():
+            return
+        heappush(self._schedule, (record.lastMoveFrame + (self.game.FPS / entity.speed), record.seq, record.version, record))
+
+    def update(self, frame_count: int):
+        collisions = self._collisions
+        touches = self._touches
+        collisions.clear()
+        touches.clear()
+        
+        # same-cell collision
+        for cell in sorted(self._crowded, key=_row_major):
+            objects = cell.get_objects()
+            for obj in objects:
+                for other in objects:
+                    if other is obj or other.is_destroyed():
+                        continue
+                    key = pair_key(obj, other)
 
-                    if isinstance(obj, Entity):
-                        if obj not in self._entities.keys():
-                            self._entities[obj] = {
-                                "lastMoveFrame": -6969
-                            }
-                            
-                    for other in cell.get_objects():
-                        if other == obj:
-                            continue
-                        pair = {obj, other}
-
-                        if obj.main_can_collide(other) and other.main_can_collide(obj):
-                            if pair not in collision_pairs:
-                                collision_pairs.append(pair)
-                                obj.main_collided_with(other)
-                                other.main_collided_with(obj)
-                        if obj.main_can_touch(other) and other.main_can_touch(obj):
-                            if pair not in touched_pairs:
-                                touched_pairs.append(pair)
-                                obj.main_touched(other)
-                                other.main_touched(obj)
+                    if obj.main_can_collide(other) and other.main_can_collide(obj):
+                        if key not in collisions:
+                            collisions[key] = (obj, other)
+                            obj.main_collided_with(other)
+                            other.main_collided_with(obj)
+                    if obj.main_can_touch(other) and other.main_can_touch(obj):
+                        if key not in touches:
+                            touches[key] = (obj, other)
+                            obj.main_touched(other)
+                            other.main_touched(obj)
         
         # movement collision
+        # store entities that are supposed to move
+        schedule = self._schedule
+        due: list[tuple[int, MoveRecord]] = [(version, record) for version, record in self._retry if version == record.version]
+        while schedule and schedule[0][0] <= frame_count:
+            _, _, version, record = heappop(schedule)
+            if version == record.version:
+                due.append((version, record))
+        due.sort(key=_seq)
+
+        # sub-steps (one cell each)
+        fps = self.game.FPS
+        stepping: list[Entity] = []
+        for _, record in due:
+            entity = record.entity
+            if entity.speed > fps:
+                record.credit += entity.speed / fps
+                steps = int(record.credit)
+                record.credit -= steps
+            else:
+                steps = 1
+            record.steps = steps
+            if steps > 0:
+                stepping.append(entity)
+
+        while len(stepping) > 0:
+            moved = self.move_step(stepping, frame_count)
+            stepping = []
+            for entity in moved:
+                record = self._entities.get(entity)
+                if record is None:
+                    continue
+                record.steps -= 1
+                if record.steps > 0:
+                    stepping.append(entity)
+
+        # reschedule (blocked entities stay due)
+        # (rescheduled mid-frame = already back in the heap)
+        retry: list[tuple[int, MoveRecord]] = []
+        for version, record in due:
+            if record.lastMoveFrame == frame_count:
+                self.schedule(record)
+            elif version == record.version:
+                retry.append((version, record))
+        self._retry = retry
+
+    def move_step(self, entities: list[Entity], frame_count: int) -> list[Entity]:
+        collisions = self._collisions
+        touches = self._touches
         target_cell_map: dict[Entity, Cell] = {}
 
-        # store entities that are supposed to move (+ trigger OOB)
-        for entity in list(self._entities):
+        # store target cells (+ trigger OOB)
+        for entity in entities:
             if entity.is_destroyed():
-                del self._entities[entity]
                 continue
 
             cell = entity.get_cell()
-            data = self._entities[entity]
-
-            # speed guard
-            if entity.speed == 0:
-                continue
-            if frame_count < (data["lastMoveFrame"] + (self.game.FPS / entity.speed)):
-                continue
             
             ori = entity.orientation
             x_move, y_move = orientation_to_move_vector(ori)
@@ -115,26 +254,29 @@ class PhysicsManager:
         moved_entities: dict[Entity, Cell] = {}
         moved_adjacent: dict[Entity, list[Entity]] = {}
         for entity, target_cell in target_cell_map.items():
+            if entity.is_destroyed():
+                continue
             can_move: bool = True
             current_cell = entity.get_cell()
+            # (**special) CHECK FOR ADJACENCY
             adjacent_entities: list[Entity] = []
+            for other in target_cell.get_entities():
+                if other in target_cell_map:
+                    if target_cell_map[other] == current_cell: # if moving towards each other
+                        adjacent_entities.append(other)
+
             for other in target_cell.get_objects():
                 if entity.main_can_collide(other) and other.main_can_collide(entity):
-                    pair = {entity, other}
-                    if pair not in collision_pairs:
-                        collision_pairs.append(pair)
+                    key = pair_key(entity, other)
+                    if key not in collisions:
+                        collisions[key] = (entity, other)
                         entity.main_collided_with(other)
                         other.main_collided_with(entity)
                     can_move = False
-
-                # (**special) CHECK FOR ADJACENCY
-                if isinstance(other, Entity) and other in target_cell_map.keys():
-                    if target_cell_map[other] == current_cell: # if moving towards each other
-                        adjacent_entities.append(other)
             
             if can_move:
                 entity.move_to(target_cell.x, target_cell.y)
-                self._entities[entity]["lastMoveFrame"] = frame_count
+                self._entities[entity].lastMoveFrame = frame_count
                 moved_entities[entity] = target_cell
                 moved_adjacent[entity] = adjacent_entities
 
@@ -142,9 +284,9 @@ class PhysicsManager:
         for entity, adjacent_entities in moved_adjacent.items():
             for other in adjacent_entities:
                 if entity.main_can_touch(other) and other.main_can_touch(entity):
-                    pair: set[GameObject] = {entity, other}
-                    if pair not in touched_pairs:
-                        touched_pairs.append(pair)
+                    key = pair_key(entity, other)
+                    if key not in touches:
+                        touches[key] = (entity, other)
                         entity.main_touched(other)
                         other.main_touched(entity)
 
@@ -152,20 +294,27 @@ class PhysicsManager:
         # trigger touched
         for entity, target_cell in moved_entities.items():
             for other in target_cell.get_objects():
-                if other == entity:
+                if other is entity:
                     continue
                 if entity.main_can_touch(other) and other.main_can_touch(entity):
-                    pair = {entity, other}
-                    if pair not in touched_pairs:
-                        touched_pairs.append(pair)
+                    key = pair_key(entity, other)
+                    if key not in touches:
+                        touches[key] = (entity, other)
                         entity.main_touched(other)
                         other.main_touched(entity)
-                    
-
-        
 
+        return [entity for entity in moved_entities if not entity.is_destroyed()]
 
+    def has_collided(self, a: GameObject, b: GameObject) -> bool:
+        return pair_key(a, b) in self._collisions
 
+    def has_touched(self, a: GameObject, b: GameObject) -> bool:
+        return pair_key(a, b) in self._touches
 
-        
-        
\ No newline at end of file
+    # ---------------------------------
+    # internal
+    def update_crowded(self, cell: Cell):
+        if cell.get_object_count() >= 2:
+            self._crowded[cell] = None
+        else:
+            self._crowded.pop(cell, None)
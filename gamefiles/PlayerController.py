@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, get_args
 
-import pyxel
+from misc.backend import pyxel
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from collections.abc import Callable
 
-import pyxel
+from misc.backend import pyxel
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
@@ -46,17 +46,18 @@ def _(game: GameField, tank: Tank):
 
 @create(powerup_type="ExtraSpeed")
 def _(game: GameField, tank: Tank):
-    def update(self: Modifier, frame_count: int):
+    # one shared layer, so picking up more doesn't stack
+    def init(self: Modifier):
         if isinstance(self.owner, Tank):
-            self.owner.stats["movementSpeed"].current = tank.stats["movementSpeed"].base*1.5
+            self.owner.stats["movementSpeed"].set_layer("ExtraSpeed", mul=1.5)
     def destroy(self: Modifier):
-        if isinstance(self.owner, Tank):
-            self.owner.stats["movementSpeed"].current = tank.stats["movementSpeed"].base
+        if isinstance(self.owner, Tank) and not self.owner.has_modifier_type("ExtraSpeed"):
+            self.owner.stats["movementSpeed"].remove_layer("ExtraSpeed")
         
     mod = Modifier(
         game=game,
         type="ExtraSpeed",
-        update=update,
+        init=init,
         destroy=destroy
     )
     tank.add_modifier(mod)
@@ -83,21 +84,22 @@ def _(game: GameField, tank: Tank):
                 return
             self.data["origOrientation"] = self.owner.orientation
             self.data["origSpeed"] = self.owner.speed
+            if isinstance(self.owner, Tank):
+                self.owner.stats["movementSpeed"].set_layer(self, mul=0)
+                self.owner.stats["fireRate"].set_layer(self, mul=0)
 
         def update(self: Modifier, frame_count: int):
             if isinstance(self.owner, Entity):
                 self.owner.set_orientation(self.data["origOrientation"])
                 self.owner.set_speed(0)
-            if isinstance(self.owner, Tank):
-                self.owner.stats["movementSpeed"].current = 0
-                self.owner.stats["fireRate"].current = 0
         def destroy(self: Modifier):
+            record.pop(self.owner, None) # (also when the owner is destroyed, pooled bullets are reused)
             if isinstance(self.owner, Entity):
                 self.owner.set_orientation(self.data["origOrientation"])
                 self.owner.set_speed(self.data["origSpeed"])
             if isinstance(self.owner, Tank):
-                self.owner.stats["movementSpeed"].current = self.owner.stats["movementSpeed"].base
-                self.owner.stats["fireRate"].current = self.owner.stats["fireRate"].base
+                self.owner.stats["movementSpeed"].remove_layer(self)
+                self.owner.stats["fireRate"].remove_layer(self)
         def can_touch(self: Modifier, other: GameObject):
             if isinstance(other, Tank):
                 if other.team == "player":
@@ -145,9 +147,7 @@ def _(game: GameField, tank: Tank):
         for y in range(game.r):
             for x in range(game.c):
                 cell = game[y, x]
-                for entity in cell.get_objects():
-                    if not isinstance(entity, Entity):
-                        continue
+                for entity in cell.get_entities():
                     if stop_conditions(entity):
                         stop_entity(entity)
                     
@@ -161,19 +161,19 @@ def _(game: GameField, tank: Tank):
     game.onObjectAdded.add_listener(on_object_added)
 
     # self-modifier buff and tag for PlayerController use (one-bullet-only rule bypass)
-    def mod_update(self: Modifier, frame_count: int):
+    def mod_init(self: Modifier):
         owner = self.owner
         if isinstance(owner, Tank):
-            owner.stats["fireRate"].current = 5
+            owner.stats["fireRate"].set_layer(self, override=5)
     def mod_destroy(self: Modifier):
         owner = self.owner
         if isinstance(owner, Tank):
-            owner.stats["fireRate"].current = owner.stats["fireRate"].base
+            owner.stats["fireRate"].remove_layer(self)
     self_mod = Modifier(
         game=game,
         type="TimeStopBuff",
         priority=6969,
-        update=mod_update,
+        init=mod_init,
         destroy=mod_destroy,
         stage_transferrable=False
     )
@@ -188,7 +188,7 @@ def _(game: GameField, tank: Tank):
         game.onObjectAdded.remove_listener(on_object_added)
         game.renderer.stop_render_custom(text)
 
-        for entity, mod in record.items():
+        for entity, mod in list(record.items()):
             entity.remove_modifier(mod)
         tank.remove_modifier(self_mod)
 
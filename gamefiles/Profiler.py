@@ -0,0 +1,201 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from time import perf_counter
+
+if TYPE_CHECKING:
+    from gamefiles.GameField import GameField
+
+'''
+Singleton for per-frame phase timing of GameField.update() and the draw pass
+Disabled by default (every call returns immediately)
+Timings are kept in a fixed-size ring buffer (one slot per frame, preallocated)
+
+PHASES:
+    GOD
+    state
+        - GameState checks
+    input
+        - PlayerController update
+    enemy
+        - EnemyController updates
+    stage
+        - Stage.update()
+    objects
+        - GameObject updates (+ onPreObjectUpdate, onPostObjectUpdate)
+    physics
+        - PhysicsManager.update() (+ onPostPhysicsUpdate)
+    signalDestroy
+        - signal destroy processing
+
+DRAW_PHASES:
+    pre_draw_grid
+    draw_cell
+        - every draw_cell() call of the frame
+    post_draw_grid
+
+Profiler
+    enabled: bool
+    overlay: bool
+        - debug overlay drawn by the Renderer (toggled with the "profiler" debug control)
+    capacity: int
+        - number of frames kept
+    counts: dict[str, int]
+        - live counts, refreshed with refresh_counts()
+            - objects: GameObjects on the grid
+            - entities: entities registered in PhysicsManager
+            - signals: live Signals
+            - listeners: listeners of live Signals
+            - signalDestroyQueue: pending signal destroys (before processing)
+            - customRenders: active Renderer custom renders
+            - effects: running Renderer effects (see gamefiles/EffectPool.py)
+            - effectsDropped: effects dropped because the pool was full (since start)
+            - redrawnCells: cells redrawn by the Renderer in the last frame (see dirty mode)
+            - bulletPoolHits, bulletPoolMisses: Bullets reused/allocated by GameField.bulletPool (since start)
+            - bulletPoolFree: Bullets ready for reuse
+
+    enable()
+    disable()
+    toggle_overlay()
+        - also enables/disables profiling (and Signal tracking for the signals/listeners counts, see SignalArena)
+    reset(capacity: int | None = None)
+        - clears all samples
+    get_samples(phase: str) -> list[float]
+        - seconds spent in phase for each recorded frame, oldest first
+        - "frame" holds the whole update() time
+    average(phase: str) -> float
+    maximum(phase: str) -> float
+    refresh_counts()
+
+    ---------------------------------
+    INTERNALS
+        - called by GameField
+
+    begin_frame()
+        - a frame is only recorded if profiling was enabled when it began
+            - (e.g. toggling the overlay mid-frame starts recording from the next frame)
+    mark(phase: str)
+        - time since the last mark (or begin_frame/begin_draw) is added to phase
+    end_frame()
+        - records the frame into the ring buffer
+    begin_draw()
+    end_draw()
+        - draw phases are recorded into the slot of the last recorded frame
+    count(name: str, value: int)
+'''
+
+PHASES = ("GOD", "state", "input", "enemy", "stage", "objects", "physics", "signalDestroy")
+DRAW_PHASES = ("pre_draw_grid", "draw_cell", "post_draw_grid")
+
+class Profiler:
+    def __init__(self, game: GameField, capacity: int = 120):
+        self.game = game
+        self.enabled = False
+        self.overlay = False
+        self._frameStart = 0.0
+        self._frameBegun = False
+        self._last = 0.0
+        self._current = dict[str, float].fromkeys(PHASES + DRAW_PHASES, 0.0)
+        self.counts = dict[str, int].fromkeys(("objects", "entities", "signals", "listeners", "signalDestroyQueue", "customRenders", "effects", "effectsDropped", "redrawnCells",
+                                                  "bulletPoolHits", "bulletPoolMisses", "bulletPoolFree"), 0)
+        self.reset(capacity)
+
+    def enable(self):
+        self.enabled = True
+    def disable(self):
+        self.enabled = False
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        self.enabled = self.overlay
+        self.game.signalArena.set_tracking(self, self.overlay) # (for the signals/listeners counts)
+        self.reset()
+
+    def reset(self, capacity: int | None = None):
+        if capacity is not None:
+            self.capacity = capacity
+        self._samples = {phase: [0.0] * self.capacity for phase in PHASES + DRAW_PHASES + ("frame",)}
+        self._index = 0
+        self._filled = 0
+
+    def get_samples(self, phase: str) -> list[float]:
+        samples = self._samples[phase]
+        if self._filled < self.capacity:
+            return samples[:self._filled]
+        return samples[self._index:] + samples[:self._index]
+
+    def average(self, phase: str) -> float:
+        if self._filled == 0:
+            return 0.0
+        return sum(self._samples[phase]) / self._filled
+
+    def maximum(self, phase: str) -> float:
+        return max(self._samples[phase])
+
+    def refresh_counts(self):
+        game = self.game
+        counts = self.counts
+        counts["objects"] = len(game._objects)
+        counts["entities"] = len(game.physics._entities)
+        counts["signals"], counts["listeners"] = game.signalArena.count()
+        counts["customRenders"] = len(game.renderer._customRenders)
+        counts["effects"] = game.renderer.effects.get_count()
+        counts["effectsDropped"] = game.renderer.effects.dropped
+        counts["redrawnCells"] = game.renderer.redrawnCells
+        counts["bulletPoolHits"] = game.bulletPool.hits
+        counts["bulletPoolMisses"] = game.bulletPool.misses
+        counts["bulletPoolFree"] = game.bulletPool.get_free_count()
+
+    # ---------------------------------
+    # internal
+    def begin_frame(self):
+        self._frameBegun = self.enabled
+        if not self.enabled:
+            return
+        current = self._current
+        for phase in PHASES:
+            current[phase] = 0.0
+        self._frameStart = self._last = perf_counter()
+
+    def mark(self, phase: str):
+        if not self.enabled or not self._frameBegun:
+            return
+        t = perf_counter()
+        self._current[phase] += t - self._last
+        self._last = t
+
+    def end_frame(self):
+        if not self.enabled or not self._frameBegun:
+            self._frameBegun = False
+            return
+        i = self._index
+        samples = self._samples
+        current = self._current
+        for phase in PHASES:
+            samples[phase][i] = current[phase]
+        for phase in DRAW_PHASES:
+            samples[phase][i] = 0.0
+        samples["frame"][i] = perf_counter() - self._frameStart
+
+        self._index = (i + 1) % self.capacity
+        if self._filled < self.capacity:
+            self._filled += 1
+
+    def begin_draw(self):
+        if not self.enabled or not self._frameBegun:
+            return
+        self._last = perf_counter()
+
+    def end_draw(self):
+        if not self.enabled or not self._frameBegun:
+            return
+        i = (self._index - 1) % self.capacity
+        samples = self._samples
+        current = self._current
+        for phase in DRAW_PHASES:
+            samples[phase][i] = current[phase]
+            current[phase] = 0.0
+
+    def count(self, name: str, value: int):
+        if not self.enabled:
+            return
+        self.counts[name] = value
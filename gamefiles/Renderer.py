@@ -1,25 +1,27 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, get_args
+from typing import TYPE_CHECKING, Any
 from collections.abc import Callable
 
-import pyxel
+from misc.backend import pyxel
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
     from objects.GameObject import GameObject
+    from objects.Item import Item
 
-from objects.Entity import Entity
 from objects.Tank import Tank
 from objects.Bullet import Bullet
-from objects.Brick import Brick
 from objects.Forest import Forest
-from objects.Mirror import Mirror
 
-from misc.util import Orientation, GameState
+from misc.util import GameState
 
 from resources.assetindex import ASSET_INDEX
 from resources.stagesettings import STAGE_SETTINGS
 from resources.controls import CONTROLS, DEBUG_CONTROLS
+from gamefiles.Profiler import PHASES, DRAW_PHASES
+from gamefiles.DrawList import DrawList
+from gamefiles.EffectPool import EffectPool
+from gamefiles.SpriteTable import SPRITES, get_render_key
 
 '''
 Singleton for rendering
@@ -29,14 +31,20 @@ Renderer
     init_stage(obj: GameObject)
         - called after stage generation
     init_object(obj: GameObject)
+        - spawns the fire effect of Bullets
+    object_destroyed(obj: GameObject)
+        - called by GameField when a registered GameObject is destroyed
+        - spawns the explosion effect of Tanks and Bullets (one game-level hook, no listener per object)
     draw_cell()
-        - store all objects into a dictionary
+        - redraws the cell's Item into the terrain layers if it changed (see Cell.get_item_version())
+        - adds all other objects to the draw list (see gamefiles/DrawList.py)
             - x
             - y
             - index
                 (u, v) on tilemap, disregards cell dimension (for easier indexing)
             - zIndex
                 - z-order of object to allow for Forest cell to cover things, as well as other necessary ordering
+                - index and zIndex come from the object's render key (see gamefiles/SpriteTable.py)
                 ORDER: (top-to-bottom is higher to lower priority)
                     - Explode effect (5)
                     - Bullet (4)
@@ -48,9 +56,41 @@ Renderer
                     - Spawn, EnemySpawn (-2)
                     - POWERUP: Mirage effect (-3)
 
+    TERRAIN LAYERS:
+        - Items (Stone, Water, Brick, Mirror, Home, Karma, ...) are pre-composited into off-screen images
+            - each one is drawn in one blit per frame, in place of its Items (same zIndex)
+            - a cell is only redrawn into them when its Item changed
+        _ground: Image | None
+            - every Item except Forest (0)
+        _canopy: Image | None
+            - Forest (2)
+        _terrainVersions: list[int]
+            - Cell item version each cell was last drawn with (-1 to force a redraw)
+
+    DIRTY MODE (off by default, see set_dirty_mode()):
+        - the screen is kept between frames and only the cells that changed are redrawn (+ the HUD strips)
+        - a cell is redrawn when:
+            - its Cell version changed (objects added/moved/destroyed, Item changes, orientation/modifier changes, ...)
+            - a render_z() sprite covers it (in the frame it is drawn and the one after, to erase it)
+            - a text/center text/profiler overlay covered it in the previous frame
+            - it is in the first or last row (HUD strips)
+            - mark_dirty() was called for it
+        - everything is redrawn on stage generation, while on the READY screen, and while the kaRMa stage flashes
+        - NOTE: custom renders must draw through render_z() (or inside the HUD strips) to be tracked,
+            call mark_dirty() for anything else !!
+        dirtyMode: bool
+        dirtyOverlay: bool
+            - outlines the cells redrawn because something changed (debug)
+        redrawnCells: int
+            - cells redrawn in the last frame (all of them outside of dirty mode)
+
+    set_dirty_mode(enabled: bool, overlay: bool = False)
+    mark_dirty(x: float, y: float, w: float, h: float)
+        - redraws the cells in the region (WINDOW coords) in the next frame
+
     pre_draw_grid()
-        - draws black background
-        - resets the dictionary for every frame
+        - draws black background (only behind redrawn cells in dirty mode)
+        - clears the draw list for every frame
     post_draw_grid()
         - lives counter
         - enemy counter
@@ -58,37 +98,77 @@ Renderer
         - victory/lose text
         - game restart/next stage buttons text
         
-        - draws all objects in the draw_cell() dictionary, sorted by zIndex
+        - draws all objects in the draw list, by zIndex (terrain layers first in their zIndex)
         - draws all custom renders
+        - draws the profiler overlay (if toggled)
     
     display_text(x: float, y: float, s: str, col: int)
         - calls pyxel.text
     display_center_text(s: str, col: int, x_offset: int = 0, y_offset: int = 0)
+    effects: EffectPool
+        - sprite effects (bullet fire, explosions, spawns, K, ...), see gamefiles/EffectPool.py
+        - cleared whenever stage is generated
     render_custom(f: Callable[[], None], duration: float)
         - call a per-frame custom renderer function for a certain duration
         - cleared whenever stage is generated
+        - NOTE: kept for compatibility (and texts), spawn sprite effects into effects instead !!
     stop_render_custom(f: Callable[[], None])
         
     render_z(x: int, y: int, index: tuple[int, int], zIndex: int)
-        - insert into next z-order rendering
+        - insert into next z-order rendering (queued, drawn after the draw_cell() objects of the same zIndex)
         - index is assetindex
         - zIndex is z-order
         - NOTE: x, y are WINDOW width/height, NOT cell index
         - NOTE: use self.game.x/self.game.y to convert cell coords
+
+    draw_profiler()
+        - per-phase average/max ms and live counts from GameField.profiler
+        - text is refreshed 4 times per second
 '''
 
 class Renderer:
     def __init__(self, game: GameField):
         self.game = game
-        self._entities: dict[Entity, dict[str, Any]] = {}
-        self._zOrder = list[dict[str, Any]]()
+        self._drawList = DrawList()
+        self.effects = EffectPool(game)
         self._customRenders = dict[Callable[[], None], dict[str, Any]]()
-        self._zOrderQueue = list[dict[str, Any]]()
+
+        fire_duration = game.FPS * 0.1
+        self._fireSequence = ((ASSET_INDEX["Explode"][0], fire_duration/2), (ASSET_INDEX["Explode"][1], fire_duration))
+        self._explodeSequence = ((ASSET_INDEX["Explode"][0], game.FPS * 0.35),)
 
         self._customTexts = list[dict[str, Any]]()
         self._centerTexts = list[dict[str, Any]]()
 
         self._karmaDebounce = 0
+
+        self._profilerLines = list[str]()
+        self._profilerRefresh = 0
+
+        # (images are only created once something is drawn)
+        self._ground: Any = None
+        self._canopy: Any = None
+        self._terrainVersions = [-1] * (game.r * game.c)
+
+        # dirty mode
+        self.dirtyMode = False
+        self.dirtyOverlay = False
+        self.redrawnCells = game.r * game.c
+        self._fullRedraw = True
+        self._redrawAll = True
+            # (current frame)
+        self._cellVersions = [-1] * (game.r * game.c)
+            # Cell version each cell was last drawn with
+        self._changed = set[int]()
+        self._refresh = set[int]()
+            # cells to redraw this frame, _changed ones are outlined in the overlay
+        self._nextChanged = set[int]()
+        self._nextRefresh = set[int]()
+        self._redrawn = list[int]()
+        self._outlined = list[int]()
+        self._hudCells = frozenset(
+            i * game.c + j for i in (0, game.r - 1) for j in range(game.c)
+        )
     
     def init(self):
         def initialize(obj: GameObject):
@@ -102,6 +182,8 @@ class Renderer:
             if state != GameState.GENERATING:
                 return
             self._customRenders = {}
+            self.effects.clear()
+            self._fullRedraw = True
         self.game.onStateChanged.add_listener(reset)
 
     def init_stage(self):
@@ -111,120 +193,89 @@ class Renderer:
                     self.init_object(obj)
 
     def init_object(self, obj: GameObject):
-        if isinstance(obj, Bullet) or isinstance(obj, Tank):
-            # bullet fire
-            if isinstance(obj, Bullet):
-                def scope(o: GameObject):
-                    duration = 0.1
-                    f = 0
-                    def fire_render():
-                        nonlocal f
-                        f += 1
-                        index = 0 if f <= self.game.FPS * duration/2 else 1
-
-                        cell = o.get_cell()
-                        x, y = cell.x, cell.y
-                        self.render_z(x=self.game.x(x), y=self.game.y(y), index=ASSET_INDEX["Explode"][index], z_index=3)
-                    self.render_custom(fire_render, duration=duration)
-                scope(obj)
-
-            # on destroy
-            def scope2(o: GameObject):
-                def render():
-                    cell = o.get_cell()
-                    x, y = cell.x, cell.y
-                    self.render_z(x=self.game.x(x), y=self.game.y(y), index=ASSET_INDEX["Explode"][0], z_index=5)
-                
-                def on_explode():
-                    if self.game.get_game_state() == GameState.GENERATING:
-                        return
-                    self.render_custom(render, duration=0.35)
-
-                o.onDestroy.add_listener(on_explode)
-            scope2(obj)
+        # bullet fire
+        if isinstance(obj, Bullet):
+            cell = obj.get_cell()
+            self.effects.spawn(self._fireSequence, self.game.x(cell.x), self.game.y(cell.y),
+                               duration=self._fireSequence[-1][1], z_index=3, priority=0, source=obj)
+
+    def object_destroyed(self, obj: GameObject):
+        # explosion
+        if not (isinstance(obj, Bullet) or isinstance(obj, Tank)):
+            return
+        if self.game.get_game_state() == GameState.GENERATING:
+            return
+        cell = obj.get_cell()
+        self.effects.spawn(self._explodeSequence, self.game.x(cell.x), self.game.y(cell.y),
+                           duration=self._explodeSequence[-1][1], z_index=5, priority=1)
 
 
     def draw_cell(self, frame_count: int, i: int, j: int, x: int, y: int):
         if self.game.get_game_state() == GameState.READY:
             return
         
+        cell = self.game[i, j]
+        k = i * self.game.c + j
+        if self.dirtyMode:
+            version = cell.get_version()
+            if not self._redrawAll:
+                if self._cellVersions[k] != version or k in self._changed:
+                    self._outlined.append(k)
+                elif k not in self._refresh:
+                    return
+                pyxel.rect(x, y, self.game.dim, self.game.dim, self._get_background())
+            self._cellVersions[k] = version
+            self._redrawn.append(k)
+
+        draw_list = self._drawList
         if (j, i) in self.game.stage.get_enemy_spawns():
-            self._zOrder.append({
-                "x": x,
-                "y": y,
-                "index": ASSET_INDEX["EnemySpawn"][0],
-                "zIndex": -2,
-            })
+            draw_list.add(x, y, ASSET_INDEX["EnemySpawn"][0], -2)
         if (j, i) == self.game.stage.get_spawn():
-            self._zOrder.append({
-                "x": x,
-                "y": y,
-                "index": ASSET_INDEX["Spawn"][0],
-                "zIndex": -2,
-            })
+            draw_list.add(x, y, ASSET_INDEX["Spawn"][0], -2)
 
-        cell = self.game[i, j]
-        for obj in cell.get_objects():
+        item = cell.get_item()
+        version = cell.get_item_version()
+        if self._terrainVersions[k] != version:
+            self._terrainVersions[k] = version
+            self._draw_terrain(item, x, y)
 
-            obj_class = type(obj)
-            index = ASSET_INDEX[obj_class]
-            z_index = 0
-            
-
-            if isinstance(obj, Entity):
-
-                if isinstance(obj, Tank):
-                    offset = 0
-                    if obj.type == "Light":
-                        offset = 8
-                    elif obj.type == "Armored":
-                        offset = 12
-                    elif obj.team == "enemy":
-                        offset = 4
-                    index = index[offset + get_args(Orientation).index(obj.orientation)]
-                    z_index = 1
-
-                    if obj.has_modifier_type("Mirage"):
-                        self._zOrder.append({
-                                "x": x,
-                                "y": y,
-                                "index": ASSET_INDEX["Mirage"][0],
-                                "zIndex": -3,
-                            })
-                        continue
-                    
-                elif isinstance(obj, Bullet):
-                    if obj.has_modifier_type("_midair"):
-                        index = index[4]
-                    else:
-                        index = index[get_args(Orientation).index(obj.orientation)]
-                    z_index = 4
-                else:
-                    index = index[0]
-
-            elif isinstance(obj, Mirror):
-                index = index[0 if obj.reflectOrientation == "northeast" else 1]
-            elif isinstance(obj, Brick):
-                index = index[0 if not obj.cracked else 1]
-            else:
-                if isinstance(obj, Forest):
-                    z_index = 2
-                index = index[0]
-
-            self._zOrder.append({
-                "x": x,
-                "y": y,
-                "index": index,
-                "zIndex": z_index
-            })
+        for obj in cell.get_objects():
+            if obj is item:
+                continue
+            key = obj.renderKey
+            if key < 0:
+                key = obj.renderKey = get_render_key(obj)
+            (index, z_index) = SPRITES[key]
+            draw_list.add(x, y, index, z_index)
+
+    def _draw_terrain(self, item: Item | None, x: int, y: int):
+        self._ground.rect(x, y, 16, 16, 0)
+        self._canopy.rect(x, y, 16, 16, 0)
+        if item is None:
+            return
+        key = item.renderKey
+        if key < 0:
+            key = item.renderKey = get_render_key(item)
+        (u_ind, v_ind) = SPRITES[key][0]
+        layer = self._canopy if isinstance(item, Forest) else self._ground
+        layer.bltm(x, y, 0, u_ind * self.game.dim, v_ind * self.game.dim, 16, 16, colkey=0)
             
     
     def pre_draw_grid(self):
-        pyxel.rect(0, 0, pyxel.width, pyxel.height, 0)
-        self._zOrder = list[dict[str, Any]]()
+        self._begin_dirty_frame()
+        if self._redrawAll:
+            pyxel.rect(0, 0, pyxel.width, pyxel.height, 0)
+        if self._ground is None:
+            width = self.game.c * self.game.dim
+            height = self.game.r * self.game.dim
+            self._ground = pyxel.Image(width, height)
+            self._canopy = pyxel.Image(width, height)
+            self._terrainVersions = [-1] * (self.game.r * self.game.c)
+        self._drawList.clear()
 
         if self.game.stage.name == "_kaRMa":
-            pyxel.rect(0, 0, pyxel.width, pyxel.height, 5)
+            if self._redrawAll:
+                pyxel.rect(0, 0, pyxel.width, pyxel.height, 5)
             if self._karmaDebounce < self.game.FPS:
                 self._karmaDebounce += 1
                 if self._karmaDebounce < self.game.FPS * 0.075:
@@ -259,22 +310,22 @@ class Renderer:
             # )
 
             # New 16x16 sprite rendering
-            for data in self._zOrderQueue:
-                self._zOrder.append(data)
-            self._zOrderQueue = []
-            self._zOrder.sort(key=lambda e: e["zIndex"])
-            for data in self._zOrder:
-                (u_ind, v_ind) = data["index"]
-                pyxel.bltm(
-                    x=data["x"],
-                    y=data["y"],
-                    w=16,
-                    h=16,
-                    tm=0,
-                    u=u_ind * self.game.dim,
-                    v=v_ind * self.game.dim,
-                    colkey=0
-                )
+            draw_list = self._drawList
+            bltm = pyxel.bltm
+            dim = self.game.dim
+            for z_index in draw_list.get_z_indices():
+                if z_index == 0:
+                    self._draw_layer(self._ground)
+                elif z_index == 2:
+                    self._draw_layer(self._canopy)
+                for bucket in draw_list.get(z_index):
+                    xs = bucket.xs
+                    ys = bucket.ys
+                    indices = bucket.indices
+                    for n in range(bucket.count):
+                        (u_ind, v_ind) = indices[n]
+                        bltm(xs[n], ys[n], 0, u_ind * dim, v_ind * dim, 16, 16, 0)
+            draw_list.clear_queue()
             
             # custom renders
             for f in list(self._customRenders):
@@ -285,6 +336,9 @@ class Renderer:
                     continue
                 f()
 
+            # effects
+            self.effects.update()
+
             lives_count = f"Lives: {self.game.stage.get_lives()}"
             pyxel.text(1,1,lives_count,12)
 
@@ -317,18 +371,126 @@ class Renderer:
 
         for data in self._customTexts:
             pyxel.text(data["x"], data["y"], data["s"], data["col"])
+            self._mark(self._nextRefresh, data["x"], data["y"], len(data["s"]) * pyxel.FONT_WIDTH, pyxel.FONT_HEIGHT)
 
         if len(self._centerTexts) > 0:
             # draw bg first
             padding = 2
             for data in self._centerTexts:
                 pyxel.rect(data["x"]-padding, data["y"]-padding, data["textWidth"]+padding*2, pyxel.FONT_HEIGHT+padding*2, 0)
+                self._mark(self._nextRefresh, data["x"]-padding, data["y"]-padding, data["textWidth"]+padding*2, pyxel.FONT_HEIGHT+padding*2)
             for data in self._centerTexts:
                 pyxel.text(data["x"], data["y"], data["s"], data["col"])
 
         self._customTexts = []
         self._centerTexts = []
+
+        if self.dirtyMode:
+            self.redrawnCells = len(self._redrawn)
+            if self.dirtyOverlay:
+                self.draw_dirty_overlay()
+        else:
+            self.redrawnCells = self.game.r * self.game.c
+
+        if self.game.profiler.overlay:
+            self.draw_profiler()
     
+    def draw_profiler(self):
+        profiler = self.game.profiler
+        self._profilerRefresh -= 1
+        if self._profilerRefresh <= 0:
+            self._profilerRefresh = max(1, self.game.FPS // 4)
+            profiler.refresh_counts()
+            lines = [f"{'ms':<14}{'avg':>6}{'max':>7}"]
+            for phase in ("frame",) + PHASES + DRAW_PHASES:
+                lines.append(f"{phase:<14}{profiler.average(phase)*1000:6.2f}{profiler.maximum(phase)*1000:7.2f}")
+            for name, value in profiler.counts.items():
+                lines.append(f"{name:<19}{value:>8}")
+            self._profilerLines = lines
+
+        x = 1
+        y = pyxel.FONT_HEIGHT + 3
+        width = max(len(line) for line in self._profilerLines) * pyxel.FONT_WIDTH
+        pyxel.rect(x - 1, y - 1, width + 2, len(self._profilerLines) * pyxel.FONT_HEIGHT + 2, 0)
+        self._mark(self._nextRefresh, x - 1, y - 1, width + 2, len(self._profilerLines) * pyxel.FONT_HEIGHT + 2)
+        for line in self._profilerLines:
+            pyxel.text(x, y, line, 7)
+            y += pyxel.FONT_HEIGHT
+
+    def draw_dirty_overlay(self):
+        dim = self.game.dim
+        for k in self._outlined:
+            i, j = divmod(k, self.game.c)
+            pyxel.rectb(self.game.x(j), self.game.y(i), dim, dim, 8)
+            self._nextRefresh.add(k)
+
+    def set_dirty_mode(self, enabled: bool, overlay: bool = False):
+        self.dirtyMode = enabled
+        self.dirtyOverlay = enabled and overlay
+        self._fullRedraw = True
+
+    def mark_dirty(self, x: float, y: float, w: float, h: float):
+        self._mark(self._nextChanged, x, y, w, h)
+
+    # ---------------------------------
+    # internal
+    def _get_background(self) -> int:
+        return 5 if self.game.stage.name == "_kaRMa" else 0
+
+    def _mark(self, cells: set[int], x: float, y: float, w: float, h: float):
+        if not self.dirtyMode:
+            return
+        dim = self.game.dim
+        j0 = max(0, int(x // dim))
+        j1 = min(self.game.c - 1, int((x + w - 1) // dim))
+        i0 = max(0, int(y // dim))
+        i1 = min(self.game.r - 1, int((y + h - 1) // dim))
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cells.add(i * self.game.c + j)
+
+    def _begin_dirty_frame(self):
+        self._redrawn.clear()
+        self._outlined.clear()
+        if not self.dirtyMode:
+            self._redrawAll = True
+            return
+
+        state = self.game.get_game_state()
+        flashing = self.game.stage.name == "_kaRMa" and self._karmaDebounce < self.game.FPS
+        if state == GameState.READY or flashing:
+            # (keep redrawing everything until the frame after)
+            self._redrawAll = True
+            self._fullRedraw = True
+        else:
+            self._redrawAll = self._fullRedraw
+            self._fullRedraw = False
+
+        self._changed, self._nextChanged = self._nextChanged, self._changed
+        self._refresh, self._nextRefresh = self._nextRefresh, self._refresh
+        self._nextChanged.clear()
+        self._nextRefresh.clear()
+
+        # queued sprites (drawn this frame, erased in the next one)
+        draw_list = self._drawList
+        for z_index in draw_list.get_z_indices():
+            queued = draw_list.get(z_index)[1]
+            for n in range(queued.count):
+                self._mark(self._changed, queued.xs[n], queued.ys[n], 16, 16)
+                self._mark(self._nextRefresh, queued.xs[n], queued.ys[n], 16, 16)
+        self._refresh |= self._hudCells
+
+    def _draw_layer(self, layer: Any):
+        if self._redrawAll:
+            pyxel.blt(0, 0, layer, 0, 0, layer.width, layer.height, 0)
+            return
+        dim = self.game.dim
+        for k in self._redrawn:
+            i, j = divmod(k, self.game.c)
+            x = self.game.x(j)
+            y = self.game.y(i)
+            pyxel.blt(x, y, layer, x, y, dim, dim, 0)
+
     def display_text(self, x: float, y: float, s: str, col: int):
         self._customTexts.append({
             "x": x,
@@ -368,9 +530,4 @@ class Renderer:
         c()
 
     def render_z(self, x: float, y: float, index: tuple[int, int], z_index: int):
-        self._zOrderQueue.append({
-            "x": x,
-            "y": y,
-            "index": index,
-            "zIndex": z_index
-        })
\ No newline at end of file
+        self._drawList.queue(x, y, index, z_index)
\ No newline at end of file
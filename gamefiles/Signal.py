@@ -3,9 +3,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
+    from objects.GameObject import GameObject
 
-from typing import TypeVar, ParamSpec, Generic
+from typing import TypeVar, ParamSpec, Generic, overload
 from collections.abc import Callable
+from types import MethodType
+from weakref import ref, WeakMethod, WeakSet
+import gc
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -15,61 +19,270 @@ Events implementation
 NOTE: cleanup (destroy) is handled asynchronously
 
 Signal(Generic[P, R])
-    add_listener(f: Callable[P, R])
+    add_listener(f: Callable[P, R], weak: bool = False)
+        - O(1), a listener can only be added once
+        - weak listeners are only weakly referenced, and are dropped once f (or the object of a bound method) is garbage collected
+            - NOTE: a closure passed as a weak listener must be kept alive by something else !!
     remove_listener(f: Callable[P, R])
+        - O(1)
+    get_listeners() -> list[Callable[P, R]]
+        - live listeners, in order
+    get_listener_count() -> int
 
     fire(*args, **kwargs)
         - dispatcher
+        - listeners are called in the order they were added
+        - safe to add/remove listeners from inside a listener:
+            - a listener removed while firing is not called anymore (if it wasn't yet)
+            - a listener added while firing is only called from the next fire()
 
     remove_listeners()
 
     is_destroyed() -> bool
     destroy()
 
+SignalArena
+    - one per GameField (GameField.signalArena)
+    - live Signals are only tracked (weakly) while something needs them (Profiler overlay, LeakDetector)
+        - nothing is done per Signal construction otherwise
+        - once tracking starts, Signals created before are found once through gc
+    - destroy() only flags the Signal (_dq) and adds it to the arena's pending list (no closure per Signal)
+    - sweep() releases every pending Signal in bulk at the end of the frame
+        - so Signals still fire for at most 1 frame after their GameObject is destroyed
+
+    sweep()
+        - called by GameField at the end of every frame
+    get_pending_count() -> int
+    set_tracking(user: object, enabled: bool)
+        - tracks live Signals while at least one user enabled it
+    is_tracking() -> bool
+    get_signals() -> list[Signal]
+        - live (not destroyed) Signals, empty if not tracking
+    count() -> tuple[int, int]
+        - number of live Signals and their listeners (0 if not tracking)
+
+    ---------------------------------
+    INTERNALS
+        - called by Signal
+
+    track(signal: Signal)
+    queue_destroy(signal: Signal)
+
+LazySignal(Generic[P, R])
+    - descriptor for GameObject signals, the Signal is only created on first access
+    - stored in the owner's "_{name}" attribute (must be initialized to None)
+        - owners fire/destroy through that attribute so nothing is created if nobody listened
+    ARGS:
+        - destroy_with_owner: bool = True
+            - if the owner is already destroyed, the created Signal is queued for destroy right away
+    - accessed on the class itself (e.g. GameObject.onDestroy), returns the LazySignal
+            
+    EXAMPLE:
+        class Foo(GameObject):
+            onBar = LazySignal[[int], None]()
+            def __init__(...):
+                self._onBar = None
+                ...
+            def bar(self):
+                if self._onBar is not None:
+                    self._onBar.fire(1)
+
 '''
 
 class Signal(Generic[P, R]):
+    __slots__ = ("game", "_listeners", "_snapshot", "_weakCount", "_destroyed", "_dq", "__weakref__")
+    _listeners: dict[Callable[P, R] | ref[Callable[P, R]], bool]
+        # (value is True for weak listeners, stored as their weakref)
+    _snapshot: tuple[tuple[Callable[P, R] | ref[Callable[P, R]], bool], ...] | None
+    _weakCount: int
     _destroyed: bool
     _dq: bool
     def __init__(self, game: GameField):
         self.game = game
-        self._listeners = list[Callable[P, R]]()
+        # insertion-ordered set + cached tuple that fire() iterates (rebuilt only after changes)
+        self._listeners = {}
+        self._snapshot = ()
+        self._weakCount = 0
         self._destroyed = False
         self._dq = False
+        arena = game.signalArena
+        if arena._tracking:
+            arena.track(self)
 
-    def add_listener(self, f: Callable[P, R]):
+    def add_listener(self, f: Callable[P, R], weak: bool = False):
         if self.is_destroyed():
             return
         if f in self._listeners:
             return
-        self._listeners.append(f)
+        if self._weakCount > 0 and self._find_weak(f) is not None:
+            return
+        if weak:
+            self._listeners[self._weak(f)] = True
+            self._weakCount += 1
+            self._snapshot = None
+            return
+        self._listeners[f] = False
+        self._snapshot = None
     def remove_listener(self, f: Callable[P, R]):
         if self.is_destroyed():
             return
         if f not in self._listeners:
-            return
-        self._listeners.remove(f)
+            if self._weakCount == 0:
+                return
+            weak_f = self._find_weak(f)
+            if weak_f is None:
+                return
+            f = weak_f # type: ignore
+        if self._listeners.pop(f):
+            self._weakCount -= 1
+        self._snapshot = None
+
+    def get_listeners(self) -> list[Callable[P, R]]:
+        listeners = list[Callable[P, R]]()
+        for f, weak in self._listeners.items():
+            if weak:
+                f = f() # type: ignore
+                if f is None:
+                    continue
+            listeners.append(f) # type: ignore
+        return listeners
+
+    def get_listener_count(self) -> int:
+        return len(self._listeners)
 
     def fire(self, *args: P.args, **kwargs: P.kwargs):
         if self.is_destroyed():
             return
-        for f in self._listeners:
-            f(*args, **kwargs)
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple(self._listeners.items())
+        for f, weak in snapshot:
+            # changed while firing, skip listeners that were removed
+            if self._snapshot is not snapshot and f not in self._listeners:
+                continue
+            if weak:
+                f = f() # type: ignore
+                if f is None:
+                    continue
+            f(*args, **kwargs) # type: ignore
     
     def remove_listeners(self):
-        self._listeners = []
+        self._listeners = {}
+        self._snapshot = ()
+        self._weakCount = 0
 
     def is_destroyed(self) -> bool:
         return self._destroyed
 
+    # ---------------------------------
+    # internal
+    def _weak(self, f: Callable[P, R]) -> ref[Callable[P, R]]:
+        if isinstance(f, MethodType):
+            return WeakMethod(f, self._prune)
+        return ref(f, self._prune)
+
+    def _find_weak(self, f: Callable[P, R]) -> ref[Callable[P, R]] | None:
+        # (lookup only, f may not support weak references if it was never added as weak)
+        try:
+            weak_f = WeakMethod(f) if isinstance(f, MethodType) else ref(f)
+        except TypeError:
+            return None
+        return weak_f if weak_f in self._listeners else None
+
+    def _prune(self, weak_f: ref[Callable[P, R]]):
+        # (weak listener was garbage collected)
+        if self._listeners.pop(weak_f, None) is not None:
+            self._weakCount -= 1
+            self._snapshot = None
+
     def destroy(self):
         if self.is_destroyed():
             return
         if self._dq:
             return
         self._dq = True
+        self.game.signalArena.queue_destroy(self)
+
+
+class SignalArena:
+    def __init__(self):
+        self._signals: WeakSet[Signal[..., object]] = WeakSet()
+        self._pending = list[Signal[..., object]]()
+        self._users = set[int]()
+        self._tracking = False
+
+    def sweep(self):
+        pending = self._pending
+        if len(pending) == 0:
+            return
+        self._pending = []
+        for signal in pending:
+            signal._destroyed = True
+            signal.remove_listeners()
+
+    def get_pending_count(self) -> int:
+        return len(self._pending)
+
+    def set_tracking(self, user: object, enabled: bool):
+        if enabled:
+            self._users.add(id(user))
+        else:
+            self._users.discard(id(user))
+        tracking = len(self._users) > 0
+        if tracking == self._tracking:
+            return
+        self._tracking = tracking
+        if not tracking:
+            self._signals = WeakSet()
+            return
+        # (Signals created while not tracking)
+        for obj in gc.get_objects():
+            if isinstance(obj, Signal) and getattr(obj.game, "signalArena", None) is self:
+                self._signals.add(obj)
+
+    def is_tracking(self) -> bool:
+        return self._tracking
+
+    def get_signals(self) -> list[Signal[..., object]]:
+        return [signal for signal in list(self._signals) if not signal.is_destroyed()]
+
+    def count(self) -> tuple[int, int]:
+        signals = 0
+        listeners = 0
+        for signal in self.get_signals():
+            signals += 1
+            listeners += signal.get_listener_count()
+        return (signals, listeners)
+
+    # ---------------------------------
+    # internal
+    def track(self, signal: Signal[..., object]):
+        self._signals.add(signal)
+
+    def queue_destroy(self, signal: Signal[..., object]):
+        self._pending.append(signal)
+
+
+class LazySignal(Generic[P, R]):
+    __slots__ = ("storage", "destroyWithOwner")
+    def __init__(self, destroy_with_owner: bool = True):
+        self.storage = ""
+        self.destroyWithOwner = destroy_with_owner
+
+    def __set_name__(self, owner: type, name: str):
+        self.storage = "_" + name
 
-        def f():
-            self._destroyed = True
-            self._listeners = []
-        self.game.queue_signal_destroy(f)
+    @overload
+    def __get__(self, obj: None, owner: type | None = None) -> LazySignal[P, R]: ...
+    @overload
+    def __get__(self, obj: GameObject, owner: type | None = None) -> Signal[P, R]: ...
+    def __get__(self, obj: GameObject | None, owner: type | None = None) -> Signal[P, R] | LazySignal[P, R]:
+        if obj is None:
+            return self
+        signal: Signal[P, R] | None = getattr(obj, self.storage)
+        if signal is None:
+            signal = Signal(obj.game)
+            setattr(obj, self.storage, signal)
+            if self.destroyWithOwner and obj.is_destroyed():
+                signal.destroy()
+        return signal
@@ -0,0 +1,86 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, get_args
+
+if TYPE_CHECKING:
+    from objects.GameObject import GameObject
+
+from objects.Tank import Tank
+from objects.Bullet import Bullet
+from objects.Brick import Brick
+from objects.Forest import Forest
+from objects.Mirror import Mirror
+
+from misc.util import Orientation, ReflectOrientation
+
+from resources.assetindex import ASSET_INDEX
+
+'''
+Sprite lookup table for GameObjects (used by Renderer)
+Built once from resources/assetindex.py
+
+Every way a GameObject can look gets a render key (int), which maps straight to its sprite and zIndex
+    - render keys are cached in GameObject.renderKey (-1 if outdated)
+    - objects outdate it themselves when their look changes (orientation, modifiers, Brick cracking, ...)
+
+KEY: (class, variant, orientation, state)
+    Tank: (Tank, "player" | "enemy" | "Light" | "Armored", Orientation, None)
+          (Tank, None, None, "Mirage")
+    Bullet: (Bullet, None, Orientation, None)
+            (Bullet, None, None, "_midair")
+    Mirror: (Mirror, None, None, ReflectOrientation)
+    Brick: (Brick, None, None, "cracked" | None)
+    any other class in ASSET_INDEX: (class, None, None, None)
+
+SPRITES: list[tuple[tuple[int, int], int]]
+    - (index, zIndex) of every render key
+    - index is assetindex
+
+get_render_key(obj: GameObject) -> int
+    - computes the render key of obj (does not use/update the cached one)
+'''
+
+SPRITES = list[tuple[tuple[int, int], int]]()
+_KEYS = dict[tuple[type, str | None, str | None, str | None], int]()
+def _add(key: tuple[type, str | None, str | None, str | None], index: tuple[int, int], z_index: int):
+    _KEYS[key] = len(SPRITES)
+    SPRITES.append((index, z_index))
+
+
+for cls, sprites in ASSET_INDEX.items():
+    if isinstance(cls, type):
+        _add((cls, None, None, None), sprites[0], 2 if cls is Forest else 0)
+
+for offset, variant in ((0, "player"), (4, "enemy"), (8, "Light"), (12, "Armored")):
+    for i, ori in enumerate(get_args(Orientation)):
+        _add((Tank, variant, ori, None), ASSET_INDEX[Tank][offset + i], 1)
+_add((Tank, None, None, "Mirage"), ASSET_INDEX["Mirage"][0], -3)
+
+for i, ori in enumerate(get_args(Orientation)):
+    _add((Bullet, None, ori, None), ASSET_INDEX[Bullet][i], 4)
+_add((Bullet, None, None, "_midair"), ASSET_INDEX[Bullet][4], 4)
+
+for i, ref_ori in enumerate(get_args(ReflectOrientation)):
+    _add((Mirror, None, None, ref_ori), ASSET_INDEX[Mirror][i], 0)
+_add((Brick, None, None, "cracked"), ASSET_INDEX[Brick][1], 0)
+
+
+def get_render_key(obj: GameObject) -> int:
+    if isinstance(obj, Tank):
+        if obj.has_modifier_type("Mirage"):
+            return _KEYS[(Tank, None, None, "Mirage")]
+        if obj.type == "Light" or obj.type == "Armored":
+            variant = obj.type
+        elif obj.team == "enemy":
+            variant = "enemy"
+        else:
+            variant = "player"
+        return _KEYS[(Tank, variant, obj.orientation, None)]
+    elif isinstance(obj, Bullet):
+        if obj.has_modifier_type("_midair"):
+            return _KEYS[(Bullet, None, None, "_midair")]
+        return _KEYS[(Bullet, None, obj.orientation, None)]
+    elif isinstance(obj, Mirror):
+        return _KEYS[(Mirror, None, None, obj.reflectOrientation)]
+    elif isinstance(obj, Brick) and obj.cracked:
+        return _KEYS[(Brick, None, None, "cracked")]
+    return _KEYS[(type(obj), None, None, None)]
@@ -87,8 +87,15 @@ Stage
     spawn_player()
         - fails if lives <= 0
 
-    get_enemies() -> list[EnemyController]
-    get_enemy_spawns() -> int
+    get_homes() -> tuple[Home, ...]
+    add_home(home: Home)
+    remove_home(home: Home)
+
+    get_enemies() -> tuple[EnemyController, ...]
+    get_enemy_spawns() -> tuple[tuple[int, int], ...]
+        - NOTE: get_homes(), get_enemies() and get_enemy_spawns() return immutable snapshots
+            - cached until the underlying list changes (no copy per call)
+            - safe to keep iterating while homes/enemies are added/removed
     get_remaining_enemy_spawns() -> int
     get_total_enemy_count() -> int
         - enemies on screen + remaining enemy spawns
@@ -103,6 +110,7 @@ Stage
         - handles periodic enemy spawning
     cleanup()
         - called before new stage is generated
+        - runs GameField.leakDetector's check first
 '''
 
 class Stage():
@@ -127,6 +135,7 @@ class Stage():
 
         self._enemySpawns = list[tuple[int, int]]()
         self._homes = list[Home]()
+        self._homesView: tuple[Home, ...] | None = None
         #filename="_kaRMa"
         stage = open(f"resources/stages/{filename}.txt", "r")
         lines = stage.readlines()
@@ -181,6 +190,8 @@ class Stage():
         self._lives = lives
         self._remainingEnemySpawns = remaining_enemy_spawns
         self._enemies = list[EnemyController]()
+        self._enemiesView: tuple[EnemyController, ...] | None = ()
+        self._enemySpawnsView = tuple(self._enemySpawns)
 
         self._spawnpoint = spawnpoint
         self._maxEnemies = self.get_total_enemy_count()
@@ -201,13 +212,18 @@ class Stage():
     def set_lives(self, lives: int):
         self._lives = lives
 
-    def get_homes(self):
-        return self._homes.copy()
+    def get_homes(self) -> tuple[Home, ...]:
+        view = self._homesView
+        if view is None:
+            view = self._homesView = tuple(self._homes)
+        return view
     
     def add_home(self, home: Home):
         self._homes.append(home)
+        self._homesView = None
     def remove_home(self, home: Home):
         self._homes.remove(home)
+        self._homesView = None
     
     def get_spawn(self):
         return self._spawnpoint
@@ -247,18 +263,21 @@ class Stage():
             self._player.tank.onDestroy.remove_listener(decrease_life)
         self._eventCleanups.append(remove_listener)
 
-        def on_spawn():
-            self.game.renderer.render_z(x=self.game.x(x), y=self.game.y(y), index=ASSET_INDEX["Spawning"][0], z_index=-1)
-        self.game.renderer.render_custom(on_spawn, duration=0.25)
+        spawn_duration = self.game.FPS * 0.25
+        self.game.renderer.effects.spawn(((ASSET_INDEX["Spawning"][0], spawn_duration),), self.game.x(x), self.game.y(y),
+                                         duration=spawn_duration, z_index=-1, priority=2)
         
         self.onPlayerAdded.fire(player)
 
     
-    def get_enemies(self):
-        return self._enemies.copy()
+    def get_enemies(self) -> tuple[EnemyController, ...]:
+        view = self._enemiesView
+        if view is None:
+            view = self._enemiesView = tuple(self._enemies)
+        return view
     
-    def get_enemy_spawns(self):
-        return self._enemySpawns.copy()
+    def get_enemy_spawns(self) -> tuple[tuple[int, int], ...]:
+        return self._enemySpawnsView
     
     def get_remaining_enemy_spawns(self):
         return self._remainingEnemySpawns
@@ -300,6 +319,7 @@ class Stage():
             if enemy not in self._enemies:
                 return
             self._enemies.remove(enemy)
+            self._enemiesView = None
             self.onEnemyRemoved.fire(enemy)
         enemy.tank.onDestroy.add_listener(remove_enemy)
 
@@ -308,6 +328,7 @@ class Stage():
         self._eventCleanups.append(remove_listener)
         
         self._enemies.append(enemy)
+        self._enemiesView = None
         self._remainingEnemySpawns -= 1
         self.onEnemyAdded.fire(enemy)
     
@@ -338,6 +359,7 @@ class Stage():
 
     
     def cleanup(self):
+        self.game.leakDetector.check()
         STAGE_SETTINGS[self.name]["cleanup"](self.game, self, self._data)
         [f() for f in self._eventCleanups]
         [obj.destroy() for r in range(self.game.r) for c in range(self.game.c) for obj in self.game[r, c].get_objects()]
@@ -95,7 +95,7 @@ def _():
 
                 self.data["origSpeed"] = owner.speed
                 self.data["frames"] = 0
-                owner.speed = 3.5
+                owner.set_speed(3.5)
 
             def update(self: Modifier, frame_count: int):
                 self.data["frames"] += 1
@@ -105,12 +105,12 @@ def _():
 
                 owner = self.owner
                 assert isinstance(owner, Bullet)
-                owner.speed = 3.5
+                owner.set_speed(3.5)
 
             def destroy(self: Modifier):
                 owner = self.owner
                 assert isinstance(owner, Bullet)
-                owner.speed = self.data["origSpeed"]
+                owner.set_speed(self.data["origSpeed"])
 
             def can_touch(self: Modifier, other: GameObject):
                 owner = self.owner
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-import pyxel
+from misc.backend import pyxel
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
@@ -41,29 +41,18 @@ def K(game: GameField, x: int, y: int, ori: Orientation):
                 obj.destroy()
             
         x_move, y_move = orientation_to_move_vector(ori)
-        f = 0
         duration = 0.6
-        current_count = count
-        def render():
-            nonlocal f
-            f += 1
-            if f <= game.FPS * (duration/2.25):
-                i = 0
-                i2 = 6
-            elif f <= game.FPS * (duration/1.5):
-                i = 2
-                i2 = 7
-            else:
-                i = 4
-                i2 = 8
-            if ori == "north" or ori == "south":
-                i += 1
+        frames = (game.FPS * (duration/2.25), game.FPS * (duration/1.5), game.FPS * duration)
+        offset = 1 if ori == "north" or ori == "south" else 0
+        effects = game.renderer.effects
+        effects.spawn(tuple((ASSET_INDEX["K"][i + offset], f) for i, f in zip((0, 2, 4), frames)),
+                      game.x(x) + (x_move/2 * game.dim), game.y(y) + (y_move/2 * game.dim),
+                      duration=frames[-1], z_index=69, priority=3)
 
-            game.renderer.render_z(x=game.x(x) + (x_move/2 * game.dim), y=game.y(y) + (y_move/2 * game.dim), index=ASSET_INDEX["K"][i], z_index=69)
-
-            if current_ori != ori or current_count == 1:
-                game.renderer.render_z(x=game.x(x), y=game.y(y), index=ASSET_INDEX["K"][i2], z_index=69)
-        game.renderer.render_custom(render, duration=duration)
+        if current_ori != ori or count == 1:
+            effects.spawn(tuple((ASSET_INDEX["K"][i], f) for i, f in zip((6, 7, 8), frames)),
+                          game.x(x), game.y(y),
+                          duration=frames[-1], z_index=69, priority=3)
 
         new_x = x + x_move
         new_y = y + y_move
@@ -1,15 +1,126 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from collections.abc import Callable
+
+if TYPE_CHECKING:
+    from gamefiles.GameField import GameField
+
+from gamefiles.Signal import Signal, LazySignal
+
 '''
 Stats value holder
 For interaction with Modifier and powerups
 
 Stat:
+    ARGS:
+        - on_changed: Callable[[], None] | None = None
+            - called directly whenever current might have changed (no Signal, meant for the Stat's owner)
+
+    game: GameField
     base: float
         - base stat, not modified
     current: float
-        - current stat, modified by Modifiers
+        - current stat, modified by Modifiers (through layers)
+        - only recomputed when read after something changed
+        - can be set directly (e.g. health -= 1), which sets the value the layers are applied on
+            - NOTE: meant for stats without layers, setting it while layered applies the layers on top again !!
+    onChanged: Signal[[], None]
+        - fired whenever current might have changed (layer added/removed/changed or current set)
+        - lazily created (see LazySignal in gamefiles/Signal.py)
 
+    set_layer(owner: object, add: float = 0, mul: float = 1, override: float | None = None)
+        - adds/updates the layer owned by owner (usually a Modifier)
+        - layers are applied in the order they were added (updating a layer keeps its place), starting from value:
+            - current = (current + add) * mul
+            - or current = override, if the layer has one
+        - e.g. a later mul=0 layer freezes a stat even if an earlier layer overrides it
+        - does nothing if the layer is unchanged
+    remove_layer(owner: object)
+    has_layer(owner: object) -> bool
+
+    destroy()
+        - destroys onChanged and drops on_changed (called by the owner)
+
+    EXAMPLE:
+        def init(self: Modifier):
+            self.owner.stats["movementSpeed"].set_layer(self, mul=1.5)
+        def destroy(self: Modifier):
+            self.owner.stats["movementSpeed"].remove_layer(self)
 '''
+
 class Stat:
-    def __init__(self, base: float, current: float | None = None):
+    __slots__ = ("game", "base", "_value", "_current", "_dirty", "_layers", "_onChanged", "_ownerCallback")
+    onChanged = LazySignal[[], None](destroy_with_owner=False)
+
+    _value: float
+    _current: float
+    _dirty: bool
+    _layers: dict[object, tuple[float, float, float | None]] | None
+    _onChanged: Signal[[], None] | None
+    _ownerCallback: Callable[[], None] | None
+    def __init__(self, game: GameField, base: float, current: float | None = None, on_changed: Callable[[], None] | None = None):
+        self.game = game
         self.base = base
-        self.current = current if current is not None else base
\ No newline at end of file
+        self._value = current if current is not None else base
+        self._current = self._value
+        self._dirty = False
+        self._layers = None
+        self._onChanged = None
+        self._ownerCallback = on_changed
+
+    @property
+    def current(self) -> float:
+        if self._dirty:
+            self._current = self._compute()
+            self._dirty = False
+        return self._current
+    @current.setter
+    def current(self, value: float):
+        self._value = value
+        self._changed()
+
+    def set_layer(self, owner: object, add: float = 0, mul: float = 1, override: float | None = None):
+        layers = self._layers
+        if layers is None:
+            layers = self._layers = {}
+        layer = (add, mul, override)
+        if layers.get(owner) == layer:
+            return
+        layers[owner] = layer
+        self._changed()
+
+    def remove_layer(self, owner: object):
+        layers = self._layers
+        if layers is None or owner not in layers:
+            return
+        del layers[owner]
+        self._changed()
+
+    def has_layer(self, owner: object) -> bool:
+        return self._layers is not None and owner in self._layers
+
+    def destroy(self):
+        self._ownerCallback = None
+        if self._onChanged is not None:
+            self._onChanged.destroy()
+
+    # ---------------------------------
+    # internal
+    def _changed(self):
+        self._dirty = True
+        if self._ownerCallback is not None:
+            self._ownerCallback()
+        if self._onChanged is not None:
+            self._onChanged.fire()
+
+    def _compute(self) -> float:
+        value = self._value
+        layers = self._layers
+        if not layers:
+            return value
+        for add, mul, override in layers.values():
+            if override is not None:
+                value = override
+            else:
+                value = (value + add) * mul
+        return value
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+
+import pyxel as _pyxel
+
+'''
+Swappable pyxel backend
+NOTE: all game modules should use the pyxel proxy here instead of importing pyxel directly !!
+    from misc.backend import pyxel
+
+pyxel: PyxelProxy
+    - forwards every attribute to the currently active backend
+    - real pyxel by default
+    - NOTE: type checkers see the real pyxel module, so every pyxel call is still checked
+
+NullPyxel
+    - headless backend (no window, no sound)
+    - drawing and sound functions are no-ops
+    - constants (KEY_*, FONT_WIDTH, FONT_HEIGHT, ...) are taken from real pyxel
+
+    width: int
+    height: int
+    frame_count: int
+        - advanced manually (see GameField.step())
+    sounds: list[None]
+
+    Image(width: int, height: int) -> NullImage
+        - off-screen images whose drawing functions are no-ops too
+
+    press(key: int)
+    release(key: int)
+    release_all()
+        - simulated button input for bots/scripted runs
+
+use_pyxel()
+    - switches back to real pyxel
+use_null_backend(width: int, height: int) -> NullPyxel
+    - switches to a fresh NullPyxel
+is_headless() -> bool
+'''
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+class NullImage:
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+    def __getattr__(self, name: str) -> Any:
+        return _noop
+
+
+class NullPyxel:
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.frame_count = 0
+        self.sounds = [None] * 64
+        self._held = set[int]()
+
+    def Image(self, width: int, height: int) -> NullImage:
+        return NullImage(width, height)
+
+    def btn(self, key: int) -> bool:
+        return key in self._held
+
+    def press(self, key: int):
+        self._held.add(key)
+    def release(self, key: int):
+        self._held.discard(key)
+    def release_all(self):
+        self._held.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes not defined above
+        attr = getattr(_pyxel, name)
+        if callable(attr):
+            return _noop
+        return attr
+
+
+class PyxelProxy:
+    __slots__ = ("_backend",)
+    _backend: Any
+    def __init__(self):
+        self._backend = _pyxel
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._backend, name)
+
+
+_proxy = PyxelProxy()
+if TYPE_CHECKING:
+    pyxel = _pyxel
+else:
+    pyxel = _proxy
+
+def use_pyxel():
+    _proxy._backend = _pyxel
+
+def use_null_backend(width: int, height: int) -> NullPyxel:
+    backend = NullPyxel(width, height)
+    _proxy._backend = backend
+    return backend
+
+def is_headless() -> bool:
+    return isinstance(_proxy._backend, NullPyxel)
@@ -9,15 +9,34 @@ if TYPE_CHECKING:
 from objects.Item import Item
 from objects.Bullet import Bullet
 
-class Brick(Item):
+'''
+Brick
     cracked: bool
+        - cracked bricks are destroyed by the next bullet
+        - refreshes the cell's Item when changed (for rendering)
+'''
+
+class Brick(Item):
+    __slots__ = ("_cracked",)
+    _cracked: bool
     def __init__(self, game: GameField, x: int, y: int,
                  cracked: bool = False,
                  
                  pre_added: Callable[[GameObject], bool] | None = None,
                  ):
-        self.cracked = cracked
+        self._cracked = cracked
         super().__init__(game=game, x=x, y=y, pre_added=pre_added)
+
+    @property
+    def cracked(self) -> bool:
+        return self._cracked
+    @cracked.setter
+    def cracked(self, cracked: bool):
+        if cracked == self._cracked:
+            return
+        self._cracked = cracked
+        self.renderKey = -1
+        self.get_cell().refresh_item()
     
     def touched(self, other: GameObject):
         if isinstance(other, Bullet):
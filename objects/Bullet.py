@@ -23,10 +23,20 @@ Bullet:
     owner: Tank
         - tag for tank who fired the bullet
         - can be changed
+
+    NOTE: pooled, create through GameField.bulletPool.bullet() (see gamefiles/BulletPool.py)
+        - released to the pool on destroy
+
+    reset(game: GameField, x: int, y: int, ori: Orientation, speed: float,
+          owner: Tank | None = None,
+          pre_added: Callable[[GameObject], bool] | None = None)
+        - reinitializes a destroyed Bullet in place (called by the pool)
+        - same as creating a new Bullet, except the hash stays the same (see GameObject.id)
 '''
 
 
 class Bullet(Entity):
+    __slots__ = ("owner", "_lastMirrorHit", "_lastKarmaHit")
     owner: Tank | None
     _lastMirrorHit: Mirror | None
     _lastKarmaHit: Karma | None
@@ -35,22 +45,45 @@ class Bullet(Entity):
                  owner: Tank | None = None,
                  pre_added: Callable[[GameObject], bool] | None = None
                  ):
+        self._init_bullet(owner=owner)
+
+        super().__init__(game=game, x=x, y=y, pre_added=pre_added, ori=ori, speed=speed)
+
+    def reset(self, game: GameField, x: int, y: int,
+              ori: Orientation, speed: float,
+              owner: Tank | None = None,
+              pre_added: Callable[[GameObject], bool] | None = None
+              ):
+        if not self.is_destroyed():
+            raise ValueError("Only destroyed Bullets can be reset.")
+        self._init_bullet(owner=owner)
+        self._init_entity(ori=ori, speed=speed)
+        self._init_object(game=game, x=x, y=y, pre_added=pre_added)
+
+    def _init_bullet(self, owner: Tank | None):
         self.owner = owner
 
         self._lastMirrorHit = None
         self._lastKarmaHit = None
 
-        super().__init__(game=game, x=x, y=y, pre_added=pre_added, ori=ori, speed=speed)
-        def on_move(x: int, y: int):
-            cell = self.get_cell()
-            if self._lastMirrorHit is not None:
-                if self._lastMirrorHit not in cell.get_objects():
-                    self._lastMirrorHit = None
-            if self._lastKarmaHit is not None:
-                if self._lastKarmaHit not in cell.get_objects():
-                    self._lastKarmaHit = None
-
-        self.onMove.add_listener(on_move)
+    def move_to(self, x: int, y: int):
+        cell = self.get_cell()
+        super().move_to(x, y)
+        if self.get_cell() is cell:
+            return
+        cell = self.get_cell()
+        if self._lastMirrorHit is not None:
+            if not cell.has_object(self._lastMirrorHit):
+                self._lastMirrorHit = None
+        if self._lastKarmaHit is not None:
+            if not cell.has_object(self._lastKarmaHit):
+                self._lastKarmaHit = None
+
+    def destroy(self):
+        if self.is_destroyed():
+            return
+        super().destroy()
+        self.game.bulletPool.release(self)
 
     def can_collide(self, other: GameObject):
         return False
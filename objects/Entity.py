@@ -6,7 +6,7 @@ if TYPE_CHECKING:
     from gamefiles.GameField import GameField
 
 from objects.GameObject import GameObject
-from gamefiles.Signal import Signal
+from gamefiles.Signal import Signal, LazySignal
 
 from misc.util import Orientation
 
@@ -19,8 +19,9 @@ Entity:
     speed: float
 
     onOrientationChanged: Signal[[Orientation], None]
-    onSpeedChanged: Signal[float], None]
-    onOutOfBounds = Signal[[], None](game)
+    onSpeedChanged: Signal[[float], None]
+    onOutOfBounds: Signal[[], None]
+        - lazily created (see GameObject)
 
     set_orientation(ori: Orientation)
     set_speed(speed: float)
@@ -41,7 +42,15 @@ Entity:
 
 '''
 class Entity(GameObject):
+    __slots__ = ("orientation", "speed", "_onOrientationChanged", "_onSpeedChanged", "_onOutOfBounds")
+    onOrientationChanged = LazySignal[[Orientation], None](destroy_with_owner=False)
+    onSpeedChanged = LazySignal[[float], None](destroy_with_owner=False)
+    onOutOfBounds = LazySignal[[], None]()
+
     orientation: Orientation
+    _onOrientationChanged: Signal[[Orientation], None] | None
+    _onSpeedChanged: Signal[[float], None] | None
+    _onOutOfBounds: Signal[[], None] | None
     def __init__(self, game: GameField, x: int, y: int,
                  ori: Orientation, speed: float,
                  
@@ -49,27 +58,37 @@ class Entity(GameObject):
                  ):
         if type(self) == Entity:
             raise ValueError("Superclass cannot be instantiated.")
+        self._init_entity(ori=ori, speed=speed)
+
+        super().__init__(game=game, x=x, y=y, pre_added=pre_added)
+
+    def _init_entity(self, ori: Orientation, speed: float):
         self.orientation = ori
         self.speed = speed
-        self.onOrientationChanged = Signal[[Orientation], None](game)
-        self.onSpeedChanged = Signal[[float], None](game)
-        self.onOutOfBounds = Signal[[], None](game)
+        self._onOrientationChanged = None
+        self._onSpeedChanged = None
+        self._onOutOfBounds = None
 
-        super().__init__(game=game, x=x, y=y, pre_added=pre_added)
-        def d():
-            self.onOutOfBounds.destroy()
-        self.onDestroy.add_listener(d)
+    def destroy(self):
+        if self.is_destroyed():
+            return
+        super().destroy()
+        if self._onOutOfBounds is not None:
+            self._onOutOfBounds.destroy()
     
     def set_orientation(self, ori: Orientation):
         if ori == self.orientation:
             return
         self.orientation = ori
-        self.onOrientationChanged.fire(ori)
+        self.refresh_render_key()
+        if self._onOrientationChanged is not None:
+            self._onOrientationChanged.fire(ori)
     def set_speed(self, speed: float):
         if speed == self.speed:
             return
         self.speed = speed
-        self.onSpeedChanged.fire(speed)
+        if self._onSpeedChanged is not None:
+            self._onSpeedChanged.fire(speed)
 
     # ---------------------------------
     # internal
@@ -77,7 +96,8 @@ class Entity(GameObject):
         if self.is_destroyed():
             return
         self.out_of_bounds()
-        self.onOutOfBounds.fire()
+        if self._onOutOfBounds is not None:
+            self._onOutOfBounds.fire()
 
     # ---------------------------------
     # method overrides
@@ -2,6 +2,7 @@ from objects.GameObject import GameObject
 from objects.Item import Item
 
 class Forest(Item):
+    __slots__ = ()
     def can_collide(self, other: GameObject):
         return False
     def can_touch(self, other: GameObject):
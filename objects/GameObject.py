@@ -1,13 +1,14 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from collections.abc import Callable
+from bisect import insort
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
     from gamefiles.Cell import Cell
 
-from gamefiles.Signal import Signal
-from gamefiles.Modifier import Modifier
+from gamefiles.Signal import Signal, LazySignal
+from gamefiles.Modifier import Modifier, no_init, no_update, no_destroy, no_can_collide, no_can_touch
 
 
 
@@ -25,12 +26,26 @@ GameObject
     game: GameField
     id: int
         - object id
+        - NOTE: objects hash on their FIRST id, which stays the same if the object is reinitialized (see _init_object())
+    renderKey: int
+        - cached render key (see gamefiles/SpriteTable.py), -1 if outdated
+        - set to -1 whenever the object's look changes (orientation, modifiers, etc.), see refresh_render_key()
+    NOTE: all signals below are only created when first accessed (see LazySignal in gamefiles/Signal.py)
     onMove: Signal[[int, int], None]
     onCollision: Signal[[GameObject], None]
     onTouched: Signal[[GameObject], None]
     onDestroy: Signal[[], None]
 
     _modifiers: list[Modifier]
+        - kept sorted by priority (insertion order among equal priorities)
+    _modifiersView: tuple[Modifier, ...] | None
+        - cached get_modifiers() result (None if outdated)
+    _modifiersVersion: int
+        - incremented every time a modifier is added/removed
+    _modifierTypes: dict[str, int] | None
+        - number of modifiers per type (None until the first modifier is added)
+    _modifierUpdates: tuple[Modifier, ...] | None
+        - modifiers that specified an update function (None if outdated)
     onModifierAdded: Signal[[Modifier], None]
     onModifierRemoved: Signal[[Modifier], None]
 
@@ -39,6 +54,12 @@ GameObject
     _cell: Cell
     _destroyed: bool
     _lastFrameCount: int
+    _hash: int
+        - stable hash (see id)
+
+    _init_object(game: GameField, x: int, y: int, pre_added: Callable[[GameObject], bool] | None = None)
+        - (re)initializes the object in place and adds it to the game (gets a new id)
+        - called by __init__, and by pools to reuse destroyed objects (see Bullet.reset())
         
     get_cell() -> Cell
     move_to(x: int, y: int):
@@ -53,9 +74,14 @@ GameObject
         - disconnects all listeners for onDestroy
     is_destroyed() -> bool
 
-    get_modifiers() -> list[Modifier]
+    refresh_render_key()
+        - outdates renderKey and refreshes the cell (for rendering)
+
+    get_modifiers() -> tuple[Modifier, ...]
+        - immutable snapshot (sorted by priority), only rebuilt after modifiers change
     has_modifier(mod: Modifier) -> bool
     has_modifier_type(type: str) -> bool
+        - O(1)
     add_modifier(mod: Modifier)
         - sets modifier and fires onModifierAdded
     remove_modifier(mod: Modifier)
@@ -79,6 +105,7 @@ GameObject
 
     update(frame_count: int)
         - called every game loop
+            - objects that don't override it are only updated while they have modifiers (see GameField.update())
         - called AFTER all modifiers are updated
         - NOTE: the object's whole update is REPEATED if modifier list is changed while updating
 
@@ -101,27 +128,61 @@ GameObject
         - called along with onTouched
 '''
 
+def _priority(mod: Modifier) -> int:
+    return mod.priority
+
 object_id = 0
 class GameObject():
+    __slots__ = ("game", "id", "renderKey", "_cell", "_destroyed", "_lastFrameCount", "_hash",
+                 "_modifiers", "_modifiersView", "_modifiersVersion", "_modifierTypes", "_modifierUpdates",
+                 "_onMove", "_onCollision", "_onTouched", "_onDestroy", "_onModifierAdded", "_onModifierRemoved",
+                 "__weakref__")
+    onMove = LazySignal[[int, int], None]()
+    onCollision = LazySignal[["GameObject"], None]()
+    onTouched = LazySignal[["GameObject"], None]()
+    onDestroy = LazySignal[[], None]()
+    onModifierAdded = LazySignal[[Modifier], None](destroy_with_owner=False)
+    onModifierRemoved = LazySignal[[Modifier], None](destroy_with_owner=False)
+
+    _onMove: Signal[[int, int], None] | None
+    _onCollision: Signal[[GameObject], None] | None
+    _onTouched: Signal[[GameObject], None] | None
+    _onDestroy: Signal[[], None] | None
+    _onModifierAdded: Signal[[Modifier], None] | None
+    _onModifierRemoved: Signal[[Modifier], None] | None
     _modifiers: list[Modifier]
+    _modifiersView: tuple[Modifier, ...] | None
+    _modifiersVersion: int
+    _modifierTypes: dict[str, int] | None
+    _modifierUpdates: tuple[Modifier, ...] | None
     _destroyed: bool
+    _hash: int
     def __init__(self, game: GameField, x: int, y: int, pre_added: Callable[[GameObject], bool] | None = None):
         if type(self) == GameObject:
             raise ValueError("Superclass cannot be instantiated.")
-        
+
+        self._hash = hash(object_id + 1) # (the id _init_object() is about to give)
+        self._init_object(game=game, x=x, y=y, pre_added=pre_added)
+
+    def _init_object(self, game: GameField, x: int, y: int, pre_added: Callable[[GameObject], bool] | None = None):
         global object_id
         object_id += 1
 
         self.game = game
         self.id = object_id
-        self.onMove = Signal[[int, int], None](game)
-        self.onCollision = Signal[[GameObject], None](game)
-        self.onTouched = Signal[[GameObject], None](game)
-        self.onDestroy = Signal[[], None](game)
+        self.renderKey = -1
+        self._onMove = None
+        self._onCollision = None
+        self._onTouched = None
+        self._onDestroy = None
 
         self._modifiers = []
-        self.onModifierAdded = Signal[[Modifier], None](game)
-        self.onModifierRemoved = Signal[[Modifier], None](game)
+        self._modifiersView = ()
+        self._modifiersVersion = 0
+        self._modifierTypes = None
+        self._modifierUpdates = ()
+        self._onModifierAdded = None
+        self._onModifierRemoved = None
 
 
         self._cell = game[y, x]
@@ -136,10 +197,11 @@ class GameObject():
             if self.is_destroyed():
                 return
             
+        self.game.register_object(self)
         self.game.onObjectAdded.fire(self)
 
     def __hash__(self):
-        return hash(self.id)
+        return self._hash
     
 
     def get_cell(self) -> Cell:
@@ -158,7 +220,8 @@ class GameObject():
         target_cell.add_object(self)
         self._cell = target_cell
 
-        self.onMove.fire(x, y)
+        if self._onMove is not None:
+            self._onMove.fire(x, y)
 
     def destroy(self):
         if self.is_destroyed():
@@ -166,40 +229,56 @@ class GameObject():
             
         self._cell.remove_object(self)
         self._destroyed = True
+        self.game.unregister_object(self)
+        self.game.leakDetector.track_destroyed(self)
 
-        self.onMove.destroy()
-        self.onCollision.destroy()
-        self.onTouched.destroy()
+        for signal in (self._onMove, self._onCollision, self._onTouched):
+            if signal is not None:
+                signal.destroy()
 
-        [mod.destroy(mod) for mod in self._modifiers]
+        [mod.destroy(mod) for mod in self._modifiers if mod.destroy is not no_destroy]
 
-        self.onDestroy.fire()
-        self.onDestroy.destroy()
+        if self._onDestroy is not None:
+            self._onDestroy.fire()
+            self._onDestroy.destroy()
 
         del self
 
     def is_destroyed(self) -> bool:
         return self._destroyed
+
+    def refresh_render_key(self):
+        self.renderKey = -1
+        self._cell.refresh()
     
-    def get_modifiers(self) -> list[Modifier]:
-        return self._modifiers.copy()
+    def get_modifiers(self) -> tuple[Modifier, ...]:
+        view = self._modifiersView
+        if view is None:
+            view = self._modifiersView = tuple(self._modifiers)
+        return view
     def has_modifier(self, mod: Modifier) -> bool:
         return mod in self._modifiers
     def has_modifier_type(self, type: str) -> bool:
-        for mod in self._modifiers:
-            if mod.type == type:
-                return True
-        return False
+        types = self._modifierTypes
+        return types is not None and type in types
     def add_modifier(self, mod: Modifier):
         if mod in self._modifiers:
             return
         
-        self._modifiers.append(mod)
-        self._modifiers.sort(key=lambda e: e.priority)
-
+        # after any modifier with the same priority
+        insort(self._modifiers, mod, key=_priority)
+        types = self._modifierTypes
+        if types is None:
+            types = self._modifierTypes = {}
+        types[mod.type] = types.get(mod.type, 0) + 1
+        self._modifiers_changed()
+
+        self.game.refresh_object(self)
         mod.tag_owner(self)
-        mod.init(mod)
-        self.onModifierAdded.fire(mod)
+        if mod.init is not no_init:
+            mod.init(mod)
+        if self._onModifierAdded is not None:
+            self._onModifierAdded.fire(mod)
 
         self.main_update(self._lastFrameCount)
 
@@ -207,53 +286,78 @@ class GameObject():
         if mod not in self._modifiers:
             return
         self._modifiers.remove(mod)
-        self._modifiers.sort(key=lambda e: e.priority)
-        mod.destroy(mod)
-        self.onModifierRemoved.fire(mod)
+        types = self._modifierTypes
+        if types is not None:
+            count = types[mod.type] - 1
+            if count == 0:
+                del types[mod.type]
+            else:
+                types[mod.type] = count
+        self._modifiers_changed()
+        self.game.refresh_object(self)
+        if mod.destroy is not no_destroy:
+            mod.destroy(mod)
+        if self._onModifierRemoved is not None:
+            self._onModifierRemoved.fire(mod)
         self.main_update(self._lastFrameCount)
     
     
     # ---------------------------------
     # internal
 
+    def _modifiers_changed(self):
+        self._modifiersVersion += 1
+        self._modifiersView = None
+        self._modifierUpdates = None
+        self.refresh_render_key()
+
     def main_update(self, frame_count: int):
         # if self.is_destroyed():
         #     return
         self._lastFrameCount = frame_count
-        copy = self._modifiers.copy()
-        for mod in self._modifiers:
-            mod.update(mod, frame_count)
-            if self._modifiers != copy:
-                return
+        if len(self._modifiers) != 0:
+            updates = self._modifierUpdates
+            if updates is None:
+                # (no-op updates can't change the modifier list, so skipping them is safe)
+                updates = self._modifierUpdates = tuple(mod for mod in self._modifiers if mod.update is not no_update)
+            version = self._modifiersVersion
+            for mod in updates:
+                mod.update(mod, frame_count)
+                if self._modifiersVersion != version:
+                    return
         self.update(frame_count)
 
     def main_can_collide(self, other: GameObject) -> bool:
         if len(self._modifiers) != 0:
             mod = self._modifiers[-1]
-            b = mod.can_collide(mod, other)
-            if b is not None:
-                return b
+            if mod.can_collide is not no_can_collide:
+                b = mod.can_collide(mod, other)
+                if b is not None:
+                    return b
         return self.can_collide(other)
 
     def main_can_touch(self, other: GameObject) -> bool:
         if len(self._modifiers) != 0:
             mod = self._modifiers[-1]
-            b = mod.can_touch(mod, other)
-            if b is not None:
-                return b
+            if mod.can_touch is not no_can_touch:
+                b = mod.can_touch(mod, other)
+                if b is not None:
+                    return b
         return self.can_touch(other)
     
     def main_collided_with(self, other: GameObject):
         # if self.is_destroyed():
         #     return
         self.collided_with(other)
-        self.onCollision.fire(other)
+        if self._onCollision is not None:
+            self._onCollision.fire(other)
 
     def main_touched(self, other: GameObject):
         # if self.is_destroyed():
         #     return
         self.touched(other)
-        self.onTouched.fire(other)
+        if self._onTouched is not None:
+            self._onTouched.fire(other)
 
 
     # ---------------------------------
@@ -8,6 +8,7 @@ from objects.Item import Item
 from objects.Bullet import Bullet
 
 class Home(Item):
+    __slots__ = ()
     def touched(self, other: GameObject):
         if isinstance(other, Bullet):
             self.destroy()
\ No newline at end of file
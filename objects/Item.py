@@ -14,6 +14,7 @@ a game object that determines a cell's type
 '''
 
 class Item(GameObject):
+    __slots__ = ()
     def __init__(self, game: GameField, x: int, y: int, pre_added: Callable[[GameObject], bool] | None = None):
         if type(self) == Item:
             raise ValueError("Superclass cannot be instantiated.")
@@ -10,6 +10,7 @@ from misc.util import ReflectOrientation
 from objects.Item import Item
 
 class Mirror(Item):
+    __slots__ = ("reflectOrientation",)
     reflectOrientation: ReflectOrientation
     def __init__(self, game: GameField, x: int, y: int,
                  ref_ori: ReflectOrientation,
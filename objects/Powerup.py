@@ -21,6 +21,7 @@ Powerup
 '''
 
 class Powerup(GameObject):
+    __slots__ = ("type", "execute")
     execute: Callable[[Tank], None]
     def __init__(self, game: GameField, x: int, y: int,
                  type: str, execute: Callable[[Tank], None],
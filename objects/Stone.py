@@ -1,4 +1,4 @@
 from objects.Item import Item
 
 class Stone(Item):
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -12,7 +12,7 @@ from objects.Entity import Entity
 from objects.GameObject import GameObject
 from objects.Bullet import Bullet
 
-from gamefiles.Signal import Signal
+from gamefiles.Signal import Signal, LazySignal
 from misc.Stat import Stat
 
 '''
@@ -22,12 +22,15 @@ Tank
     team: Team
     isMoving: bool
     onBulletFired: Signal[[Bullet], None]
+        - lazily created (see GameObject)
     stats: {
         "health": Stat
         "movementSpeed": Stat
         "fireRate": Stat
         "bulletSpeed": Stat
     }
+        - Modifiers change them through layers (see misc/Stat.py)
+        - movementSpeed and fireRate call back into the Tank directly when changed (no Signals)
 
     start_moving()
     stop_moving()
@@ -41,13 +44,24 @@ Tank
     can_fire_bullet() -> bool
         - based on fireRate
 
+    _movementSpeed: float
+    _fireInterval: float | None
+        - frames between shots (None if fireRate is 0)
+        - both only recomputed when their Stat changes
 '''
 
 class Tank(Entity):
+    __slots__ = ("team", "type", "isMoving", "stats", "_lastFireFrame", "_bulletFired", "_canFireBullet",
+                 "_movementSpeed", "_fireInterval", "_onBulletFired")
+    onBulletFired = LazySignal[[Bullet], None]()
+
     team: Team
+    _onBulletFired: Signal[[Bullet], None] | None
     isMoving: bool
     _bulletFired: bool
     _canFireBullet: bool
+    _movementSpeed: float
+    _fireInterval: float | None
     def __init__(self, game: GameField, x: int, y: int,
                  
                  team: Team, tank_type: str,
@@ -62,15 +76,16 @@ class Tank(Entity):
         self.team = team
         self.type = tank_type
         self.isMoving = False
-        self.onBulletFired = Signal[[Bullet], None](game)
+        self._onBulletFired = None
 
         self.stats = {
-            "health": Stat(health),
-            "movementSpeed": Stat(movement_speed),
-            "fireRate": Stat(fire_rate),
-            "bulletSpeed": Stat(bullet_speed)
+            "health": Stat(game, health),
+            "movementSpeed": Stat(game, movement_speed, on_changed=self._on_movement_speed_changed),
+            "fireRate": Stat(game, fire_rate, on_changed=self._on_fire_rate_changed),
+            "bulletSpeed": Stat(game, bullet_speed)
         }
-
+        self._movementSpeed = movement_speed
+        self._fireInterval = None if fire_rate == 0 else game.FPS / fire_rate
 
 
         self._lastFireFrame = -6969
@@ -78,9 +93,15 @@ class Tank(Entity):
         self._canFireBullet = True
 
         super().__init__(game=game, x=x, y=y, pre_added=pre_added, ori="north", speed=0)
-        def d():
-            self.onBulletFired.destroy()
-        self.onDestroy.add_listener(d)
+
+    def destroy(self):
+        if self.is_destroyed():
+            return
+        super().destroy()
+        if self._onBulletFired is not None:
+            self._onBulletFired.destroy()
+        for stat in self.stats.values():
+            stat.destroy()
 
     def start_moving(self):
         self.isMoving = True
@@ -105,15 +126,15 @@ class Tank(Entity):
             return
         self._bulletFired = True
 
-        bullet = Bullet(
-            game=self.game,
+        bullet = self.game.bulletPool.bullet(
             owner=self,
             x=self.get_cell().x + x_move,
             y=self.get_cell().y + y_move,
             ori=ori,
             speed=self.stats["bulletSpeed"].current
             )
-        self.onBulletFired.fire(bullet)
+        if self._onBulletFired is not None:
+            self._onBulletFired.fire(bullet)
         return bullet
     
     def can_fire_bullet(self) -> bool:
@@ -125,16 +146,23 @@ class Tank(Entity):
             self.destroy()
             return
         
-        self.set_speed(0 if not self.isMoving else self.stats["movementSpeed"].current)
+        self.set_speed(0 if not self.isMoving else self._movementSpeed)
 
         if self._bulletFired:
             self._bulletFired = False
             self._lastFireFrame = frame_count
 
-        if self.stats["fireRate"].current == 0: # sneaky
+        if self._fireInterval is None: # sneaky
             self._canFireBullet = False
         else:
-            self._canFireBullet = not (frame_count < (self._lastFireFrame + (self.game.FPS / self.stats["fireRate"].current)))
+            self._canFireBullet = not (frame_count < (self._lastFireFrame + self._fireInterval))
+
+    def _on_movement_speed_changed(self):
+        self._movementSpeed = self.stats["movementSpeed"].current
+
+    def _on_fire_rate_changed(self):
+        fire_rate = self.stats["fireRate"].current
+        self._fireInterval = None if fire_rate == 0 else self.game.FPS / fire_rate
 
     def can_touch(self, other: GameObject):
         if isinstance(other, Bullet):
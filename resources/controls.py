@@ -1,4 +1,4 @@
-import pyxel
+from misc.backend import pyxel
 from typing import Any
 
 CONTROLS: dict[str, dict[str, Any]] = {
@@ -69,6 +69,14 @@ DEBUG_CONTROLS: dict[str, dict[str, Any]] = {
         "name": "T",
         "btn": pyxel.KEY_T,
     },
+    "profiler": {
+        "name": "F",
+        "btn": pyxel.KEY_F,
+    },
+    "dirty": {
+        "name": "G",
+        "btn": pyxel.KEY_G,
+    },
 
 
 
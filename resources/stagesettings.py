@@ -1,9 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 from collections.abc import Callable
-from random import choice, randint
 
-import pyxel
+from misc.backend import pyxel
 
 if TYPE_CHECKING:
     from gamefiles.GameField import GameField
@@ -148,11 +147,11 @@ def _():
 
                     if len(empty_cells) > 0:
                         
-                        chosen_cell = choice(empty_cells)
+                        chosen_cell = game.rng.choice(empty_cells)
                         game.powerupFactory.powerup(
                             x=chosen_cell.x,
                             y=chosen_cell.y,
-                            powerup_type=choice(game.powerupFactory.get_powerup_types()))
+                            powerup_type=game.rng.choice(game.powerupFactory.get_powerup_types()))
                 
             if enemy_count <= max_enemies * 0.65:
                 if enemy_count == 0:
@@ -196,7 +195,7 @@ def _():
                     for _ in range(karma_count):
                         if len(mirrors) == 0:
                             break
-                        mirror = choice(mirrors)
+                        mirror = game.rng.choice(mirrors)
                         mirrors.remove(mirror)
                         cell = mirror.get_cell()
                         mirror.destroy()
@@ -223,7 +222,7 @@ def _():
                 else:
                     # good luck. :]
                     tank_type = "Light"
-                stage.spawn_enemy_delayed(spawn_index=randint(0, l-1), tank_type=tank_type)
+                stage.spawn_enemy_delayed(spawn_index=game.rng.randint(0, l-1), tank_type=tank_type)
 
         if data["kUses"] > 0:
             if pyxel.btn(DEBUG_CONTROLS["K"]["btn"]):
@@ -326,11 +325,11 @@ for d in STAGE_SETTINGS.values():
 
                     if len(empty_cells) > 0:
                         
-                        chosen_cell = choice(empty_cells)
+                        chosen_cell = game.rng.choice(empty_cells)
                         game.powerupFactory.powerup(
                             x=chosen_cell.x,
                             y=chosen_cell.y,
-                            powerup_type=choice(game.powerupFactory.get_powerup_types()))
+                            powerup_type=game.rng.choice(game.powerupFactory.get_powerup_types()))
             
             stage.onEnemyRemoved.add_listener(spawn_powerup)
             def remove_listener():
@@ -343,7 +342,7 @@ for d in STAGE_SETTINGS.values():
             if l > 0:
                 if frame_count > (data["lastSpawnFrame"] + (game.FPS * data["spawnInterval"])):
                     data["lastSpawnFrame"] = frame_count
-                    stage.spawn_enemy_delayed(spawn_index=randint(0, l-1), tank_type=choice(game.tankFactory.get_tank_types()))
+                    stage.spawn_enemy_delayed(spawn_index=game.rng.randint(0, l-1), tank_type=game.rng.choice(game.tankFactory.get_tank_types()))
 
         def default_cleanup(game: GameField, stage: Stage, data: dict[str, Any]):
             [f() for f in data["eventCleanups"]]
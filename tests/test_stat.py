@@ -0,0 +1,56 @@
+import unittest
+
+from gamefiles.GameField import GameField
+from gamefiles.PowerupFactory import POWERUPS
+from misc.Stat import Stat
+from objects.Tank import Tank
+
+'''
+Stat layers
+NOTE: run from the repository root (stage files are loaded relative to it)
+    python -m unittest discover tests
+'''
+
+class StatLayerTest(unittest.TestCase):
+    def test_layers_apply_in_order(self):
+        stat = Stat(None, 2) # type: ignore
+        stat.set_layer("buff", override=5)
+        stat.set_layer("freeze", mul=0)
+        self.assertEqual(stat.current, 0)
+
+        stat.remove_layer("freeze")
+        self.assertEqual(stat.current, 5)
+        stat.remove_layer("buff")
+        self.assertEqual(stat.current, 2)
+
+    def test_override_after_mul(self):
+        stat = Stat(None, 2) # type: ignore
+        stat.set_layer("speed", mul=1.5)
+        stat.set_layer("buff", override=5)
+        self.assertEqual(stat.current, 5)
+        stat.set_layer("speed", mul=2) # (keeps its place)
+        self.assertEqual(stat.current, 5)
+
+    def test_time_stop_buff_then_enemy_time_stop(self):
+        game = GameField(fps=60, headless=True, seed=11)
+        game.start_stage("3")
+        enemies = list[Tank]()
+        for _ in range(game.FPS * 30):
+            game.step()
+            enemies = [o for o in game.get_objects() if isinstance(o, Tank) and o.team == "enemy"]
+            if len(enemies) >= 2:
+                break
+        self.assertGreaterEqual(len(enemies), 2)
+        first, second = enemies[:2]
+
+        POWERUPS["TimeStop"](game, first)
+        self.assertEqual(first.stats["fireRate"].current, 5)
+
+        POWERUPS["TimeStop"](game, second)
+        game.step()
+        self.assertEqual(first.stats["fireRate"].current, 0)
+        self.assertEqual(first.stats["movementSpeed"].current, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()